@@ -1,40 +1,245 @@
 # ===== Imports =====
 from flask import Flask, request, jsonify, send_file
-import swisseph as swe
-from timezonefinder import TimezoneFinder
 from datetime import datetime, timedelta
-import pytz
-from pytz import exceptions as tzex
 import uuid
 import os
-import resend
-import base64
-import openai
-import requests
+import io
+import hashlib
+import hmac
+import json
 import logging
-
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import ParagraphStyle, TA_CENTER, TA_JUSTIFY
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor, black
+import threading
+import time
+from collections import OrderedDict
+
+from lazy_imports import lazy_import, warm_up
+from singleflight import SingleFlight
+from llm_backends import get_llm_backend, estimate_cost
+from metrics import REGISTRY
+from prompts import get_template
+from knowledge_entries import CONTENT as KNOWLEDGE_CONTENT
+from html_templates import render_report, size_report
+from pdf_cache import PdfCache, spec_key
+from pdf_pool import PdfRenderPool, PoolBusy
+from pdf_report import report_spec, render_spec
+from report_document import parse_report
+from report_renderers import register as register_renderer, render_all
+from email_outbox import Outbox, OutboxSender
+from email_transports import get_email_transport
+from narrative_cache import (
+    NarrativeCache, personalize, placements_from_chart, render_prompt
+)
+
+# Heavy dependencies load on first use so /test and /ping boot fast.
+# EAGER_IMPORTS=1 imports them all at startup instead.
+swe = lazy_import("swisseph", on_load=lambda m: m.set_ephe_path('.'))  # ephemeris files in working dir or system path
+timezonefinder = lazy_import("timezonefinder")
+pytz = lazy_import("pytz")
+requests = lazy_import("requests")
+# Imported where used (llm_backends, pdf_report); registered so warm_up() covers them.
+for _deferred in ("openai", "reportlab.platypus", "pdf_styles"):
+    lazy_import(_deferred)
 
 # ===== App Setup =====
 app = Flask(__name__)
 logging.basicConfig(level=logging.DEBUG)
 
 # ===== API Keys / Config =====
-openai.api_key = os.getenv("OPENAI_API_KEY")
-resend.api_key = os.getenv("RESEND_API_KEY")
+# OPENAI_API_KEY is read by llm_backends when the openai module first loads.
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")  # must be set in Render
-
-# ===== Swiss Ephemeris =====
-swe.set_ephe_path('.')  # expects ephemeris files in working dir or system path
+# RESEND_API_KEY / RESEND_API_URL / EMAIL_TIMEOUT are read by email_transports.
+
+if os.getenv("EAGER_IMPORTS") == "1":
+    warm_up()
+
+# ===== LLM Backend =====
+# LLM_BACKEND=mock or LLM_API_BASE=<stand-in> for offline load testing
+llm = get_llm_backend()
+AI_MODEL = os.getenv("AI_MODEL", "gpt-4")
+AI_MAX_TOKENS = int(os.getenv("AI_MAX_TOKENS", "2000"))
+REPORT_PROMPT = get_template("report")  # PROMPT_VARIANT=full|compact
+
+# Pre-generated narratives per placement combination (scripts/prewarm_narrative_cache.py)
+NARRATIVE_CACHE_PATH = os.getenv("NARRATIVE_CACHE_PATH")
+narrative_cache = NarrativeCache(NARRATIVE_CACHE_PATH) if NARRATIVE_CACHE_PATH else None
+
+# ===== AI Metrics =====
+_AI_LABELS = ("model", "backend", "prompt")
+ai_prompt_tokens = REGISTRY.histogram(
+    "ai_prompt_tokens", "Prompt tokens per completion",
+    [100, 200, 300, 400, 600, 800, 1200, 1600, 2400], _AI_LABELS)
+ai_completion_tokens = REGISTRY.histogram(
+    "ai_completion_tokens", "Completion tokens per completion",
+    [250, 500, 750, 1000, 1250, 1500, 1750, 2000, 3000, 4000], _AI_LABELS)
+ai_ttft_seconds = REGISTRY.histogram(
+    "ai_time_to_first_token_seconds", "Time to first streamed token",
+    [0.25, 0.5, 1, 1.5, 2, 3, 5, 8, 13], _AI_LABELS)
+ai_latency_seconds = REGISTRY.histogram(
+    "ai_latency_seconds", "Total completion latency",
+    [1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120], _AI_LABELS)
+ai_cost_usd = REGISTRY.histogram(
+    "ai_cost_usd", "Estimated completion cost in USD",
+    [0.01, 0.02, 0.05, 0.08, 0.1, 0.15, 0.2, 0.3], _AI_LABELS)
+
+def record_ai_metrics(completion):
+    """Export one completion's sizes, timings and cost estimate."""
+    labels = {"model": AI_MODEL, "backend": llm.name, "prompt": REPORT_PROMPT.key}
+    cost = estimate_cost(AI_MODEL, completion.prompt_tokens, completion.completion_tokens)
+    ai_prompt_tokens.observe(completion.prompt_tokens, **labels)
+    ai_completion_tokens.observe(completion.completion_tokens, **labels)
+    if completion.ttft is not None:
+        ai_ttft_seconds.observe(completion.ttft, **labels)
+    ai_latency_seconds.observe(completion.latency, **labels)
+    ai_cost_usd.observe(cost, **labels)
+    ttft = f"{completion.ttft:.2f}s" if completion.ttft is not None else "n/a"
+    print(f"DEBUG >>> AI completion: prompt_tokens={completion.prompt_tokens} "
+          f"completion_tokens={completion.completion_tokens} ttft={ttft} "
+          f"latency={completion.latency:.2f}s cost=${cost:.4f}")
+
+# ===== Knowledge Content =====
+# KB_WATCH=1 reloads knowledge content in every worker when the files change;
+# POST /admin/reload-knowledge (X-Admin-Token: $ADMIN_TOKEN) reloads the worker that serves it.
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+KB_WATCH = os.getenv("KB_WATCH") == "1"
+
+def start_knowledge_watch():
+    """This process's knowledge watcher; gunicorn.conf.py post_fork calls it in each worker."""
+    if KB_WATCH:
+        KNOWLEDGE_CONTENT.watch(float(os.getenv("KB_WATCH_INTERVAL", "2")))
+
+start_knowledge_watch()
+
+# ===== PDF Rendering =====
+# PDF_RENDER_WORKERS=<n> renders PDFs in a per-worker process pool (pdf_pool.py)
+# so ReportLab layout doesn't hold this process's GIL; 0 renders in the request thread.
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "0"))
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+# Rendered PDFs keyed by a hash of their inputs and the template version, shared by all workers
+PDF_CACHE_PATH = os.getenv("PDF_CACHE_PATH")
+pdf_cache = PdfCache(PDF_CACHE_PATH, int(os.getenv("PDF_CACHE_MAX_MB", "256")) * 1024 * 1024) if PDF_CACHE_PATH else None
+
+pdf_render_seconds = REGISTRY.histogram(
+    "pdf_render_seconds", "PDF render time including queueing (mode=cache for cache hits)",
+    [0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2, 5, 10, 30], ("mode",))
+
+def get_pdf_pool():
+    """This process's render pool, started on first use (never shared across fork)."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None or _pdf_pool.pid != os.getpid():
+            _pdf_pool = PdfRenderPool(
+                workers=PDF_RENDER_WORKERS,
+                max_queue=int(os.getenv("PDF_RENDER_QUEUE", "8")),
+                timeout=float(os.getenv("PDF_RENDER_TIMEOUT", "30")),
+                max_jobs=int(os.getenv("PDF_RENDER_MAX_JOBS", "500")),
+            )
+        return _pdf_pool
+
+# ===== Email Transport / Outbox =====
+# EMAIL_TRANSPORT=mock or RESEND_API_URL=<stand-in> for offline load testing
+email_transport = get_email_transport()
+
+# Emails carry the minified report HTML; EMAIL_HTML_MINIFY=0 sends report.html as written.
+EMAIL_HTML_FORMAT = "html_min" if os.getenv("EMAIL_HTML_MINIFY", "1") == "1" else "html"
+email_html_bytes = REGISTRY.histogram(
+    "email_html_bytes", "HTML body size per report email",
+    [8192, 16384, 32768, 65536, 102 * 1024, 262144])
+
+def check_email_html(html_body):
+    """Record the body size and warn when it is past the clipping budget (html_templates.size_report)."""
+    report = size_report(html_body)
+    email_html_bytes.observe(report.total)
+    if report.over:
+        print(f"[email] HTML body {report.total} bytes exceeds budget {report.budget} "
+              f"(style {report.style}, markup {report.markup}, text {report.text})")
+    return html_body
+
+# EMAIL_OUTBOX_PATH=<sqlite file> queues report emails durably (email_outbox.py) and
+# returns from /process-form before delivery; unset sends inline.
+EMAIL_OUTBOX_PATH = os.getenv("EMAIL_OUTBOX_PATH")
+email_outbox = Outbox(EMAIL_OUTBOX_PATH) if EMAIL_OUTBOX_PATH else None
+_email_sender = None
+_email_sender_lock = threading.Lock()
+
+email_send_seconds = REGISTRY.histogram(
+    "email_send_seconds", "Email provider call latency (single or batch)",
+    [0.1, 0.25, 0.5, 1, 2, 5, 10, 30])
+
+def get_email_sender():
+    """This process's outbox sender threads, started on first use (never shared across fork)."""
+    global _email_sender
+    with _email_sender_lock:
+        if _email_sender is None or _email_sender.pid != os.getpid():
+            _email_sender = OutboxSender(
+                email_outbox, email_transport.send, email_transport.send_batch,
+                workers=int(os.getenv("EMAIL_SENDERS", "2")),
+                batch_size=int(os.getenv("EMAIL_BATCH_SIZE", "10")),
+                max_attempts=int(os.getenv("EMAIL_MAX_ATTEMPTS", "8")),
+                base_delay=float(os.getenv("EMAIL_RETRY_BASE", "5")),
+                max_delay=float(os.getenv("EMAIL_RETRY_MAX", "900")),
+                retain_sent=float(os.getenv("EMAIL_RETAIN_SENT_DAYS", "7")) * 86400,
+                retain_failed=float(os.getenv("EMAIL_RETAIN_FAILED_DAYS", "30")) * 86400,
+                observe=email_send_seconds.observe,
+            ).start()
+        return _email_sender
+
+def form_idempotency_key(data):
+    """Same form payload on the same (UTC) day -> same key, so webhook retries send one email."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    day = datetime.utcnow().strftime("%Y-%m-%d")
+    return "report-" + hashlib.sha256(f"{day}\n{payload}".encode()).hexdigest()[:32]
 
 # ===== Globals =====
-temp_files = {}
+# Rendered PDFs for /download, kept in memory (oldest dropped past DOWNLOAD_MAX_FILES).
+temp_files = OrderedDict()
+temp_files_lock = threading.Lock()
+DOWNLOAD_MAX_FILES = int(os.getenv("DOWNLOAD_MAX_FILES", "256"))
+
+def remember_download(file_id, pdf_bytes):
+    with temp_files_lock:
+        temp_files[file_id] = pdf_bytes
+        while len(temp_files) > DOWNLOAD_MAX_FILES:
+            temp_files.popitem(last=False)
+
+# Identical placement requests that arrive while a completion is in flight
+# share that completion instead of each calling OpenAI.
+AI_COALESCE_TIMEOUT = float(os.getenv("AI_COALESCE_TIMEOUT", "120"))
+ai_flight = SingleFlight()
 
 # ===== Helpers =====
+_tf = None
+_tf_lock = threading.Lock()
+
+def timezone_at(latitude, longitude):
+    """Timezone name for a coordinate using one shared TimezoneFinder per process."""
+    global _tf
+    with _tf_lock:
+        if _tf is None:
+            _tf = timezonefinder.TimezoneFinder()
+        return _tf.timezone_at(lat=latitude, lng=longitude)
+
+def preload_shared_state():
+    """
+    Build read-only data in the pre-fork master (gunicorn PRELOAD_APP=1) so
+    workers share the pages instead of each building their own copy: deferred
+    imports and in-memory timezone polygons (numpy buffers, never touched by
+    refcounting). Knowledge content is left to knowledge_store's on-demand
+    reads; its entries snapshot is built only when something uses it.
+    Nothing that holds files or sockets open is created here or at import:
+    ephemeris files are opened per worker, and the SQLite stores (narrative
+    cache, PDF cache, email outbox) connect and create their schema on first
+    use in the worker. gunicorn.conf.py freezes the heap with gc.freeze()
+    right before forking.
+    """
+    global _tf
+    start = time.perf_counter()
+    warm_up()
+    with _tf_lock:
+        _tf = timezonefinder.TimezoneFinder(in_memory=True)
+    return round(time.perf_counter() - start, 4)
+
 def get_zodiac_sign(longitude):
     signs = [
         "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
@@ -56,16 +261,15 @@ def calculate_nodes_and_big_three(birthdate, birthtime, latitude, longitude):
         naive = datetime.strptime(dt_str, "%Y-%m-%d %H:%M")
 
         # 2) Resolve timezone
-        tf = TimezoneFinder()
-        tz_name = tf.timezone_at(lat=latitude, lng=longitude) or "UTC"
+        tz_name = timezone_at(latitude, longitude) or "UTC"
         tz = pytz.timezone(tz_name)
 
         # 3) Localize safely with DST awareness
         try:
             local_dt = tz.localize(naive, is_dst=None)
-        except tzex.AmbiguousTimeError:
+        except pytz.exceptions.AmbiguousTimeError:
             local_dt = tz.localize(naive, is_dst=False)
-        except tzex.NonExistentTimeError:
+        except pytz.exceptions.NonExistentTimeError:
             local_dt = tz.localize(naive + timedelta(hours=1), is_dst=True)
 
         # 4) Convert to UTC
@@ -120,291 +324,131 @@ def calculate_nodes_and_big_three(birthdate, birthtime, latitude, longitude):
         print(traceback.format_exc())
         return None
 
-def generate_ai_report(chart_data, first_name):
-    """Generate the narrative report via OpenAI. Avoid em dashes in prompt."""
-    sun_sign = chart_data.get('sun_sign', 'Unknown')
-    moon_sign = chart_data.get('moon_sign', 'Unknown')
-    rising_sign = chart_data.get('rising_sign', 'Unknown')
-    north_node_sign = chart_data.get('north_node', {}).get('sign', 'Unknown')
-    south_node_sign = chart_data.get('south_node', {}).get('sign', 'Unknown')
-
-    prompt = f"""
-You are an expert astrologer. Write a personalized report for {first_name}.
-Do not use em dashes. Use plain periods or commas.
-
-Placements:
-Sun {sun_sign}; Moon {moon_sign}; Rising {rising_sign}; North Node {north_node_sign}; South Node {south_node_sign}.
-
-Create exactly these sections with clear headers:
-
-SECTION: Your Cosmic Blueprint
-[2–3 short paragraphs introducing {first_name} to their combination. No em dashes.]
-
-SECTION: Your Inner Light - Sun in {sun_sign}
-[2 short paragraphs on {sun_sign} core identity. No em dashes.]
-
-SECTION: Your Emotional Nature - Moon in {moon_sign}
-[2 short paragraphs on emotions and needs. No em dashes.]
-
-SECTION: Your Rising Persona - {rising_sign} Ascending
-[2 short paragraphs on first impression and approach. No em dashes.]
-
-SECTION: Your Soul's Journey - The Nodal Pathway
-[3 short paragraphs: growth from {south_node_sign} to {north_node_sign}. No em dashes.]
-
-SECTION: Integration and Growth
-[2–3 short paragraphs of practical guidance. No em dashes.]
-
-Use {first_name}'s name naturally. Counseling tone. No em dashes.
-"""
+def fallback_ai_report(first_name):
+    return f"""SECTION: Your Personal Report
+Hi {first_name}. Your report could not be generated automatically. Please contact support."""
 
+def generate_ai_report(chart_data, first_name):
+    """
+    Generate the narrative report via OpenAI.
+    Text is always generated for NAME_TOKEN and personalized on the way out,
+    so concurrent calls for the same placements share one completion
+    whatever the reader's name; with the narrative cache enabled it is also
+    stored once per placement combination.
+    """
+    placements = placements_from_chart(chart_data)
+    if narrative_cache:
+        narrative_cache.record_lookup(placements)
+        cached = narrative_cache.get(REPORT_PROMPT.digest, placements)
+        if cached is not None:
+            return personalize(cached, first_name)
+
+    key = (REPORT_PROMPT.digest,) + placements
     try:
-        # If you use the new Chat Completions API name:
-        # resp = openai.ChatCompletion.create(...)
-        resp = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=2000,
-            temperature=0.7
+        text, shared = ai_flight.do(
+            key,
+            lambda: _complete_ai_report(placements),
+            timeout=AI_COALESCE_TIMEOUT
         )
-        return resp.choices[0].message.content.strip()
+    except TimeoutError as e:
+        print("OpenAI coalescing timeout:", e)
+        return fallback_ai_report(first_name)
     except Exception as e:
         print("OpenAI error:", e)
-        fallback = f"""SECTION: Your Personal Report
-Hi {first_name}. Your report could not be generated automatically. Please contact support."""
-        return fallback
-
-def create_pdf_report(ai_text, first_name="Friend", chart_data=None):
+        return fallback_ai_report(first_name)
+    if shared:
+        print("DEBUG >>> AI report shared from in-flight request:", key)
+    return personalize(text, first_name)
+
+def _complete_ai_report(placements):
+    """Single upstream completion for NAME_TOKEN, stored in the narrative cache when enabled."""
+    prompt = render_prompt(REPORT_PROMPT, placements)
+    completion = llm.complete(prompt, model=AI_MODEL, max_tokens=AI_MAX_TOKENS, temperature=0.7)
+    record_ai_metrics(completion)
+    if narrative_cache:
+        narrative_cache.put(REPORT_PROMPT.digest, placements, completion.text)
+    return completion.text
+
+def render_pdf_report(document, theme=None):
+    """Render a parsed ReportDocument as a styled PDF in memory and return its bytes."""
+    spec = report_spec(document, theme)
+    start = time.perf_counter()
+    key = spec_key(spec) if pdf_cache else None
+    if key:
+        pdf_bytes = pdf_cache.get(key)
+        if pdf_bytes is not None:
+            pdf_render_seconds.observe(time.perf_counter() - start, mode="cache")
+            return pdf_bytes
+    if PDF_RENDER_WORKERS > 0:
+        pdf_bytes, mode = get_pdf_pool().render(spec), "pool"
+    else:
+        pdf_bytes, mode = render_spec(spec), "inline"
+    pdf_render_seconds.observe(time.perf_counter() - start, mode=mode)
+    if key:
+        pdf_cache.put(key, pdf_bytes)
+    return pdf_bytes
+
+register_renderer("pdf", "application/pdf", render_pdf_report, background=True)
+# The emailed PDF has no chart table (the HTML body shows it)
+register_renderer("pdf_attachment", "application/pdf",
+                  lambda document: render_pdf_report(document._replace(chart=None)), background=True)
+
+def create_pdf_report(ai_text, first_name="Friend", chart_data=None, theme=None):
     """Create a styled PDF and return file path."""
-    filename = f"nodal_report_{uuid.uuid4()}.pdf"
-    filepath = f"/tmp/{filename}"
-
-    doc = SimpleDocTemplate(
-        filepath,
-        pagesize=A4,
-        rightMargin=0.8*inch, leftMargin=0.8*inch,
-        topMargin=1*inch, bottomMargin=1*inch
-    )
-
-    gold = HexColor('#edd598')
-    dark = HexColor('#2d3748')
-    muted = HexColor('#555555')
-
-    # Styles
-    title_style = ParagraphStyle(
-        'Title',
-        fontSize=30,
-        textColor=gold,
-        spaceAfter=24,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=34
-    )
-    subtitle_style = ParagraphStyle(
-        'Subtitle',
-        fontSize=14,
-        textColor=muted,
-        spaceAfter=36,
-        alignment=TA_CENTER,
-        fontName='Helvetica',
-        leading=20
-    )
-    section_style = ParagraphStyle(
-        'SectionHeader',
-        fontSize=18,
-        textColor=dark,
-        spaceBefore=18,
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold',
-        leading=22
-    )
-    body_style = ParagraphStyle(
-        'Body',
-        fontSize=13,
-        textColor=black,
-        spaceAfter=12,
-        alignment=TA_JUSTIFY,
-        fontName='Helvetica',
-        leading=18
-    )
-    disclaimer_style = ParagraphStyle(
-        'Disclaimer',
-        fontSize=11,
-        textColor=dark,
-        spaceBefore=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Oblique',
-        leading=15
-    )
-
-    story = []
-    # Cover
-    story.append(Paragraph("Nodal Pathways", title_style))
-    story.append(Paragraph(f"Personalized Astrological Report for {first_name}", subtitle_style))
-
-    # Chart Essentials table
-    if chart_data:
-        chart_rows = [
-            ["Sun", chart_data.get("sun_sign", "")],
-            ["Moon", chart_data.get("moon_sign", "")],
-            ["Rising", chart_data.get("rising_sign", "")],
-            ["North Node", chart_data.get("north_node", {}).get("sign", "")],
-            ["South Node", chart_data.get("south_node", {}).get("sign", "")]
-        ]
-        t = Table(chart_rows, colWidths=[1.8*inch, None])
-        t.setStyle(TableStyle([
-            ("FONTNAME", (0,0), (-1,-1), "Helvetica"),
-            ("FONTSIZE", (0,0), (-1,-1), 12),
-            ("TEXTCOLOR", (0,0), (0,-1), gold),   # labels in gold
-            ("TEXTCOLOR", (1,0), (1,-1), dark),   # values in dark navy
-            ("LINEBELOW", (0,0), (-1,-1), 0.25, muted),
-            ("LEFTPADDING", (0,0), (-1,-1), 6),
-            ("RIGHTPADDING", (0,0), (-1,-1), 6),
-            ("TOPPADDING", (0,0), (-1,-1), 4),
-            ("BOTTOMPADDING", (0,0), (-1,-1), 4),
-        ]))
-        story.append(t)
-        story.append(Spacer(1, 0.3*inch))
-
-    # Narrative sections
-    sections = [s for s in ai_text.split('SECTION:') if s.strip()]
-    for sec in sections:
-        lines = [ln.strip() for ln in sec.strip().split('\n') if ln.strip()]
-        if not lines:
-            continue
-        header = lines[0].replace("SECTION:", "").strip()
-        story.append(Paragraph(header, section_style))
-        text = ' '.join(lines[1:])
-        for p in text.split('. '):
-            if p:
-                if not p.endswith('.'):
-                    p += '.'
-                story.append(Paragraph(p, body_style))
-
-    # Disclaimer + instructions
-    story.append(PageBreak())
-    story.append(Paragraph(
-        "You can download and print this report using the attachment or your browser’s print option.",
-        disclaimer_style
-    ))
-    story.append(Paragraph(
-        "Guiding you on your cosmic journey of self-discovery. "
-        "For entertainment and self-reflection purposes only. Not predictive or definitive.",
-        disclaimer_style
-    ))
-
-    doc.build(story)
+    filepath = f"/tmp/nodal_report_{uuid.uuid4()}.pdf"
+    with open(filepath, 'wb') as f:
+        f.write(render_pdf_report(parse_report(ai_text, first_name, chart_data), theme))
     return filepath
     
 def create_html_report(chart_data, ai_text, first_name="Friend"):
     """Generate styled HTML with dark section headers, chart essentials, disclaimer, and instructions."""
+    return render_report(parse_report(ai_text, first_name, chart_data))
 
-    # Essentials block
-    chart_basics = f"""
-    <div class="chart-basics">
-        <h3>Chart Essentials for {first_name}</h3>
-        <div class="basics-grid">
-            <div class="basic-item"><strong>Sun Sign:</strong> {chart_data['sun_sign']}</div>
-            <div class="basic-item"><strong>Moon Sign:</strong> {chart_data['moon_sign']}</div>
-            <div class="basic-item"><strong>Rising Sign:</strong> {chart_data['rising_sign']}</div>
-            <div class="basic-item"><strong>North Node:</strong> {chart_data['north_node']['sign']}</div>
-            <div class="basic-item"><strong>South Node:</strong> {chart_data['south_node']['sign']}</div>
-        </div>
-    </div>
-    """
-
-    # Parse AI text into sections
-    sections_html = []
-    sections = [s.strip() for s in ai_text.split("SECTION:") if s.strip()]
-    for sec in sections:
-        lines = [ln.strip() for ln in sec.split("\n") if ln.strip()]
-        if not lines:
-            continue
-        header = lines[0].replace("SECTION:", "").strip()
-        body_text = " ".join(lines[1:])
-        paragraphs = [p.strip() for p in body_text.split(". ") if p.strip()]
-
-        sec_html = f"<div class='section'><h2>{header}</h2>"
-        for p in paragraphs:
-            if not p.endswith("."):
-                p += "."
-            sec_html += f"<p>{p}</p>"
-        sec_html += "</div>"
-        sections_html.append(sec_html)
-
-    sections_content = "\n".join(sections_html)
-
-    # Full HTML
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-<meta charset="UTF-8">
-<title>Nodal Pathways Report - {first_name}</title>
-<style>
-body {{ font-family: -apple-system, BlinkMacSystemFont, Inter, Helvetica, Arial, sans-serif; background:#ffffff; color:#111; margin:0; }}
-.container {{ max-width: 900px; margin: 0 auto; padding: 24px; }}
-.header {{ text-align:center; padding: 36px 12px; background:#2d3748; border-radius:16px; }}
-.header h1 {{ color:#edd598; margin:0 0 8px 0; }}
-.header .subtitle {{ color:#e2e8f0; }}
-.basics-grid {{ display:grid; grid-template-columns:1fr 1fr; gap:12px; }}
-.basic-item {{ background:#2a3141; border:1px solid #3a4151; padding:14px; border-radius:10px; color:#e2e8f0; }}
-strong {{ color:#edd598; }}
-.section h2 {{ color:#2d3748; text-align:center; margin:28px 0 12px; font-size:20px; }}
-.section p {{ line-height:1.6; text-align:left; margin-bottom:14px; }}
-.footer {{ text-align:center; margin-top:32px; padding:24px; background:#2d3748; border-radius:14px; color:#e2e8f0; }}
-.disclaimer {{ margin:22px auto; max-width:760px; text-align:center; color:#2d3748; font-size:13px; }}
-.instructions {{ text-align:center; font-size:13px; color:#2d3748; margin-top:30px; }}
-</style>
-</head>
-<body>
-<div class="container">
-  <div class="header">
-    <h1>Nodal Pathways</h1>
-    <div class="subtitle">Personalized Astrological Report for {first_name}</div>
-  </div>
-  {chart_basics}
-  {sections_content}
-  <p class="instructions">
-    You can download and print this report using the attachment or your browser’s print option.
-  </p>
-  <div class="disclaimer">
-    Guiding you on your cosmic journey of self-discovery.<br>
-    For entertainment and self-reflection purposes only. Not predictive or definitive.
-  </div>
-  <div class="footer">
-    Nodal Pathways
-  </div>
-</div>
-</body>
-</html>"""
-    return html
-
-def send_report_email(email, html_body, pdf_path):
-    """Email via Resend with attached PDF."""
-    with open(pdf_path, 'rb') as f:
-        pdf_b64 = base64.b64encode(f.read()).decode('utf-8')
-
-    resend.Emails.send({
+def report_email_params(email, html_body, pdf_bytes, text_body=None):
+    """Resend params for a report email; the attachment carries the raw PDF bytes."""
+    params = {
         "from": "reports@api.nodalpathways.com",
         "to": email,
         "subject": "Your Nodal Pathways Report",
         "html": html_body,
         "attachments": [{
             "filename": "nodal_pathways_report.pdf",
-            "content": pdf_b64
+            "content": pdf_bytes  # base64-encoded in chunks while the request body streams
         }]
-    })
+    }
+    if text_body:
+        params["text"] = text_body
+    return params
+
+def send_report_email(email, html_body, pdf_bytes, text_body=None, idempotency_key=None):
+    """Email the report now with the PDF bytes attached (and a plain-text part when given)."""
+    return email_transport.send(report_email_params(email, html_body, pdf_bytes, text_body), idempotency_key)
 
 # ===== Routes =====
 @app.route('/test', methods=['GET'])
 def test():
     return jsonify({"status": "ok"})
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return REGISTRY.render(), 200, {"Content-Type": "text/plain; version=0.0.4"}
+
 @app.route('/ping', methods=['POST'])
 def ping():
     return jsonify({"parsed": request.get_json(silent=True)})
 
+@app.route('/admin/reload-knowledge', methods=['POST'])
+def reload_knowledge():
+    token = request.headers.get("X-Admin-Token", "")
+    if not ADMIN_TOKEN or not hmac.compare_digest(token, ADMIN_TOKEN):
+        return jsonify({"error": "Forbidden"}), 403
+    force = bool((request.get_json(silent=True) or {}).get("force"))
+    try:
+        changed, version = KNOWLEDGE_CONTENT.reload(force=force)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"status": "ok", "changed": changed, "version": version, "pid": os.getpid()})
+
 @app.route('/report', methods=['POST'])
 def report_pdf():
     """Generate a PDF from raw 'report' text. Returns download URL and filename."""
@@ -414,20 +458,23 @@ def report_pdf():
         if not report_text:
             return jsonify({"error": "Missing 'report'"}), 400
 
-        file_path = create_pdf_report(report_text, data.get("first_name", "Friend"))
-        file_id = file_path.rsplit('/', 1)[-1].replace('.pdf', '')
-        temp_files[file_id] = file_path
+        pdf_bytes = render_pdf_report(parse_report(report_text, data.get("first_name", "Friend")))
+        file_id = f"nodal_report_{uuid.uuid4()}"
+        remember_download(file_id, pdf_bytes)
         download_url = f"{request.url_root}download/{file_id}"
-        return jsonify({"download_url": download_url, "filename": file_path.rsplit('/',1)[-1]})
+        return jsonify({"download_url": download_url, "filename": f"{file_id}.pdf"})
+    except PoolBusy as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 400
 
 @app.route('/download/<file_id>', methods=['GET'])
 def download(file_id):
-    path = temp_files.get(file_id)
-    if not path or not os.path.exists(path):
+    pdf_bytes = temp_files.get(file_id)
+    if pdf_bytes is None:
         return jsonify({"error": "File not found"}), 404
-    return send_file(path, mimetype='application/pdf', as_attachment=True, download_name=os.path.basename(path))
+    return send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf', as_attachment=True,
+                     download_name=f"{file_id}.pdf")
 
 @app.route('/process-form', methods=['POST'])
 def process_form():
@@ -456,6 +503,16 @@ def process_form():
         if not GOOGLE_API_KEY:
             return jsonify({"error": "GOOGLE_API_KEY not set"}), 400
 
+        # A retried submission is answered from the outbox without regenerating the report;
+        # one whose earlier email failed for good is generated and queued again.
+        idempotency_key = request.headers.get("Idempotency-Key") or form_idempotency_key(data)
+        if email_outbox and email_outbox.status(idempotency_key) in ("pending", "sending", "sent"):
+            return jsonify({
+                "status": "success",
+                "message": f"Report already queued for {email}",
+                "duplicate": True
+            })
+
         location_str = f"{city}, {state}, {country}" if state else f"{city}, {country}"
         geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
         params = {"address": location_str, "key": GOOGLE_API_KEY}
@@ -476,29 +533,95 @@ def process_form():
             return jsonify({"error": "Chart calculation failed"}), 400
 
         ai_content = generate_ai_report(chart_data, first_name)
-        html_content = create_html_report(chart_data, ai_content, first_name)
-        pdf_path = create_pdf_report(ai_content, first_name)
-
-        try:
-            send_report_email(email, html_content, pdf_path)
-        finally:
-            try:
-                os.remove(pdf_path)
-            except Exception:
-                pass
+        document = parse_report(ai_content, first_name, chart_data)
+        outputs = render_all(document, (EMAIL_HTML_FORMAT, "pdf_attachment"))
+        html_body = check_email_html(outputs[EMAIL_HTML_FORMAT])
+
+        if email_outbox:
+            email_outbox.enqueue(idempotency_key, report_email_params(
+                email, html_body, outputs["pdf_attachment"]))
+            get_email_sender().wake()
+            return jsonify({
+                "status": "success",
+                "message": f"Report queued for {email}",
+                "chart_data": chart_data
+            })
 
+        send_report_email(email, html_body, outputs["pdf_attachment"], idempotency_key=idempotency_key)
         return jsonify({
             "status": "success",
             "message": f"Report sent successfully to {email}",
             "chart_data": chart_data
         })
 
+    except PoolBusy as e:
+        print("PROCESS-FORM BUSY:", e)
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         import traceback
         print("PROCESS-FORM ERROR:", e)
         print(traceback.format_exc())
         return jsonify({"error": str(e)}), 400
 
+# ===== Warm-up =====
+WARM_STATE = {"status": "cold", "pid": os.getpid(), "started": None, "seconds": None, "steps": {}, "error": None}
+# WARM_WORKERS=0 turns warm-up off (gunicorn.conf.py skips it, /ready doesn't wait for it)
+WARM_ENABLED = os.getenv("WARM_WORKERS", "1") == "1" or os.getenv("WARM_ON_IMPORT") == "1"
+_warm_lock = threading.Lock()
+
+def warm_worker():
+    """
+    Pay first-request costs up front: heavy imports, ephemeris files, timezone
+    data and ReportLab fonts (by rendering a dummy chart, HTML and PDF once). Call from a gunicorn post_fork hook (see gunicorn.conf.py)
+    or set WARM_ON_IMPORT=1. Failures are recorded, not raised.
+    """
+    WARM_STATE.update(status="warming", pid=os.getpid(), started=time.time(), error=None)
+    start = time.perf_counter()
+
+    def step(name, fn):
+        t = time.perf_counter()
+        fn()
+        WARM_STATE["steps"][name] = round(time.perf_counter() - t, 4)
+
+    try:
+        step("imports", warm_up)
+        chart = {}
+        step("chart", lambda: chart.update(
+            calculate_nodes_and_big_three("2000-01-01", "12:00", 40.7128, -74.0060) or {}))
+        sample = "SECTION: Warm-up\nThis is a warm-up paragraph. It is not sent anywhere."
+        document = parse_report(sample, "Friend", chart)
+        step("html", lambda: render_report(document))
+        step("pdf", lambda: render_pdf_report(document))
+        if email_outbox:
+            step("outbox", get_email_sender)  # drain mail queued before a restart
+        if not chart:
+            raise RuntimeError("dummy chart calculation failed")
+        WARM_STATE["status"] = "warm"
+    except Exception as e:
+        WARM_STATE.update(status="cold", error=str(e))
+        print("[warm_worker] warm-up failed:", e)
+    WARM_STATE["seconds"] = round(time.perf_counter() - start, 4)
+    return WARM_STATE
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Readiness probe: 200 once this worker is warm, 503 while cold. A worker
+    nothing has warmed yet (e.g. not started through gunicorn.conf.py) warms
+    on its first probe; with warm-up disabled it is always ready.
+    """
+    if not WARM_ENABLED:
+        return jsonify(dict(WARM_STATE, status="disabled", pid=os.getpid())), 200
+    if WARM_STATE["started"] is None:
+        with _warm_lock:
+            if WARM_STATE["started"] is None:
+                warm_worker()
+    state = dict(WARM_STATE, pid=os.getpid())
+    return jsonify(state), (200 if state["status"] == "warm" else 503)
+
+if os.getenv("WARM_ON_IMPORT") == "1":
+    warm_worker()
+
 # ===== Main =====
 if __name__ == '__main__':
     # For local testing
@@ -0,0 +1,358 @@
+# email_outbox.py
+"""
+Durable outbound email queue.
+
+/process-form writes the finished email (params plus attachment bytes) to a
+local SQLite outbox and returns; OutboxSender threads in every worker claim
+due messages and deliver them, so provider latency and outages never reach
+the request and a failed send is retried instead of discarding the report.
+
+- idempotency: each message has a key (the Resend Idempotency-Key too);
+  enqueueing a key that is queued or sent is a no-op, so webhook retries
+  send one email; a key whose message failed is reset and queued afresh
+- claims are leases: a claimed message becomes due again after `lease`
+  seconds, so one whose worker died mid-send is picked up by another. The
+  lease is renewed right before each send (and counts the attempt then);
+  a sender whose lease expired meanwhile skips the message, and finish()
+  only records outcomes for rows still held under the caller's lease
+- retries back off exponentially with jitter up to max_delay; permanent
+  errors (SendError(retryable=False)) and messages out of attempts are
+  kept with status 'failed'
+- retention: senders purge sent rows after retain_sent seconds and failed
+  rows (with their attachments) after retain_failed, so the file stays bounded
+- batching: due messages are claimed and finished batch_size at a time in
+  one transaction each, and messages without attachments go out through a
+  single batch API call when a send_batch function is given
+"""
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+
+class SendError(Exception):
+    """Delivery failed; retryable=False marks errors a retry cannot fix (e.g. 422)."""
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+class Message:
+    __slots__ = ("key", "params", "attempts", "lease")
+
+    def __init__(self, key, params, attempts, lease):
+        self.key = key
+        self.params = params
+        self.attempts = attempts
+        self.lease = lease  # next_attempt_at written by our claim/renew; identifies the holder
+
+    @property
+    def has_attachments(self):
+        return bool(self.params.get("attachments"))
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS outbox (
+        key             TEXT PRIMARY KEY,
+        params          TEXT,
+        status          TEXT,
+        attempts        INTEGER,
+        next_attempt_at REAL,
+        last_error      TEXT,
+        provider_id     TEXT,
+        created_at      REAL,
+        updated_at      REAL
+    );
+    CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+    CREATE TABLE IF NOT EXISTS outbox_attachments (
+        key      TEXT,
+        position INTEGER,
+        content  BLOB,
+        PRIMARY KEY (key, position)
+    ) WITHOUT ROWID;
+"""
+
+class Outbox:
+    """SQLite-backed message store, safe to share between threads and worker processes."""
+
+    def __init__(self, path, lease=120):
+        self.path = path
+        self.lease = lease
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():  # never reuse a connection across fork
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)  # explicit transactions
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            conn.executescript(_SCHEMA)  # first use in this process/thread, never at import
+        return conn
+
+    def status(self, key):
+        """'pending', 'sending', 'sent', 'failed', or None for an unknown key."""
+        row = self._conn().execute("SELECT status FROM outbox WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def enqueue(self, key, params):
+        """
+        Store a message whose attachments carry raw bytes; False if the key is
+        already queued or sent. A failed message under the key is replaced.
+        """
+        meta = dict(params)
+        attachments = [dict(a) for a in params.get("attachments", ())]
+        contents = [a.pop("content") for a in attachments]
+        if attachments:
+            meta["attachments"] = attachments
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = conn.execute(
+                "INSERT INTO outbox VALUES (?,?,'pending',0,?,NULL,NULL,?,?) "
+                "ON CONFLICT (key) DO UPDATE SET params = excluded.params, status = 'pending', "
+                "attempts = 0, next_attempt_at = excluded.next_attempt_at, last_error = NULL, "
+                "provider_id = NULL, created_at = excluded.created_at, updated_at = excluded.updated_at "
+                "WHERE outbox.status = 'failed'",
+                (key, json.dumps(meta), now, now, now)
+            )
+            if cur.rowcount:
+                conn.execute("DELETE FROM outbox_attachments WHERE key = ?", (key,))
+                conn.executemany(
+                    "INSERT INTO outbox_attachments VALUES (?,?,?)",
+                    [(key, i, sqlite3.Binary(c)) for i, c in enumerate(contents)]
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return bool(cur.rowcount)
+
+    def claim(self, limit):
+        """Lease up to limit due messages to the caller; returns [Message]."""
+        now = time.time()
+        lease = now + self.lease
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT key, params, attempts FROM outbox "
+                "WHERE status IN ('pending', 'sending') AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?", (now, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE outbox SET status = 'sending', next_attempt_at = ?, updated_at = ? WHERE key = ?",
+                [(lease, now, key) for key, _, _ in rows]
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        messages = []
+        for key, params, attempts in rows:
+            params = json.loads(params)
+            if params.get("attachments"):
+                blobs = conn.execute(
+                    "SELECT content FROM outbox_attachments WHERE key = ? ORDER BY position", (key,)
+                ).fetchall()
+                for attachment, (content,) in zip(params["attachments"], blobs):
+                    attachment["content"] = content
+            messages.append(Message(key, params, attempts, lease))
+        return messages
+
+    def renew(self, messages):
+        """
+        Extend the lease of messages about to be sent and count the attempt;
+        returns those still held (a message whose lease expired may have been
+        claimed by another sender and must not be sent again).
+        """
+        now = time.time()
+        lease = now + self.lease
+        held = []
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for m in messages:
+                cur = conn.execute(
+                    "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ?, updated_at = ? "
+                    "WHERE key = ? AND status = 'sending' AND next_attempt_at = ?",
+                    (lease, now, m.key, m.lease))
+                if cur.rowcount:
+                    m.lease = lease
+                    m.attempts += 1
+                    held.append(m)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return held
+
+    def finish(self, results):
+        """
+        Record outcomes in one transaction. results: [(message, status, detail, retry_at)]
+        with status 'sent' (detail = provider id), 'pending' (retry at retry_at)
+        or 'failed' (detail = error). Rows no longer held under message.lease
+        are left alone.
+        """
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for m, status, detail, retry_at in results:
+                if status == "sent":
+                    cur = conn.execute(
+                        "UPDATE outbox SET status = 'sent', provider_id = ?, last_error = NULL, "
+                        "updated_at = ? WHERE key = ? AND status = 'sending' AND next_attempt_at = ?",
+                        (detail, now, m.key, m.lease))
+                    if cur.rowcount:
+                        conn.execute("DELETE FROM outbox_attachments WHERE key = ?", (m.key,))
+                else:
+                    conn.execute(
+                        "UPDATE outbox SET status = ?, last_error = ?, next_attempt_at = ?, updated_at = ? "
+                        "WHERE key = ? AND status = 'sending' AND next_attempt_at = ?",
+                        (status, detail, retry_at or now, now, m.key, m.lease))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def purge(self, sent_older_than, failed_older_than):
+        """Delete sent / failed messages last updated more than that many seconds ago; returns the count."""
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            keys = [key for (key,) in conn.execute(
+                "SELECT key FROM outbox WHERE (status = 'sent' AND updated_at < ?) "
+                "OR (status = 'failed' AND updated_at < ?)",
+                (now - sent_older_than, now - failed_older_than))]
+            conn.executemany("DELETE FROM outbox_attachments WHERE key = ?", [(k,) for k in keys])
+            conn.executemany("DELETE FROM outbox WHERE key = ?", [(k,) for k in keys])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return len(keys)
+
+    def stats(self):
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM outbox GROUP BY status")
+        return dict(rows.fetchall())
+
+class OutboxSender:
+    """
+    Worker threads draining an Outbox. send(params, idempotency_key) returns
+    the provider message id or raises; send_batch([params]) returns one id per
+    message and is only used for messages without attachments.
+    """
+
+    def __init__(self, outbox, send, send_batch=None, workers=2, batch_size=10,
+                 max_attempts=8, base_delay=5.0, max_delay=900.0, poll_interval=1.0, observe=None,
+                 retain_sent=7 * 86400, retain_failed=30 * 86400, purge_interval=3600):
+        self.outbox = outbox
+        self.send = send
+        self.send_batch = send_batch
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.observe = observe  # observe(seconds) per send / send_batch call
+        self.retain_sent = retain_sent
+        self.retain_failed = retain_failed
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self.pid = os.getpid()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._purge_lock = threading.Lock()
+
+    def start(self):
+        for i in range(self.workers):
+            t = threading.Thread(target=self._loop, name=f"outbox-sender-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def stop(self, timeout=5):
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+
+    def wake(self):
+        """Look for due messages now instead of at the next poll."""
+        self._wake.set()
+
+    def _purge_due(self):
+        """Purge old rows at most every purge_interval seconds (one sender thread at a time)."""
+        with self._purge_lock:
+            now = time.monotonic()
+            if now < self._next_purge:
+                return
+            self._next_purge = now + self.purge_interval
+        purged = self.outbox.purge(self.retain_sent, self.retain_failed)
+        if purged:
+            print(f"[outbox] purged {purged} old messages")
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self._purge_due()
+                claimed = self.run_once()
+            except Exception as e:
+                print("[outbox] sender error:", e)
+                claimed = 0
+            if not claimed:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def backoff(self, attempts):
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _outcome(self, message, error):
+        if isinstance(error, SendError) and not error.retryable:
+            return (message, "failed", str(error), None)
+        if message.attempts >= self.max_attempts:
+            return (message, "failed", f"gave up after {message.attempts} attempts: {error}", None)
+        return (message, "pending", str(error), time.time() + self.backoff(message.attempts))
+
+    def _timed(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            if self.observe:
+                self.observe(time.perf_counter() - start)
+
+    def run_once(self):
+        """Claim and deliver one batch; returns how many messages were claimed."""
+        claimed = self.outbox.claim(self.batch_size)
+        if not claimed:
+            return 0
+        messages = claimed
+        plain = [m for m in messages if not m.has_attachments] if self.send_batch else []
+        if len(plain) > 1:
+            plain = self.outbox.renew(plain)
+            results = []
+            try:
+                ids = self._timed(self.send_batch, [m.params for m in plain]) if plain else []
+                results.extend((m, "sent", provider_id, None) for m, provider_id in zip(plain, ids))
+            except Exception as e:
+                results.extend(self._outcome(m, e) for m in plain)
+            self.outbox.finish(results)
+            messages = [m for m in messages if m.has_attachments]
+        for m in messages:
+            # renewed and finished per send, so a slow batch never outlives its claim
+            if not self.outbox.renew([m]):
+                continue
+            try:
+                result = (m, "sent", self._timed(self.send, m.params, m.key), None)
+            except Exception as e:
+                print(f"[outbox] send {m.key} attempt {m.attempts} failed:", e)
+                result = self._outcome(m, e)
+            self.outbox.finish([result])
+        return len(claimed)
@@ -0,0 +1,63 @@
+# email_payload.py
+"""
+Streaming JSON request bodies for the email API, with base64 attachments
+encoded on the fly.
+
+The Resend SDK needs each attachment as a base64 str inside a params dict,
+which it then serializes to a JSON str and encodes to bytes: three full-size
+copies of the (4/3 larger) encoded PDF on top of the PDF itself, per email in
+flight. EmailBody instead serializes everything except the attachment
+contents up front and, when the HTTP client iterates it, yields that JSON
+around base64 chunks encoded straight from memoryview slices of the PDF
+bytes. Its length is known in advance, so requests sends it with a plain
+Content-Length and the peak extra memory per email is one chunk.
+"""
+import binascii
+import json
+import uuid
+
+CHUNK_SIZE = 3 * 16 * 1024  # a multiple of 3, so chunks encode without inner padding
+
+def b64_length(n):
+    return (n + 2) // 3 * 4
+
+def b64_chunks(data, chunk_size=CHUNK_SIZE):
+    """Base64 of data (bytes-like) as a sequence of bytes chunks."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield binascii.b2a_base64(view[start:start + chunk_size], newline=False)
+
+class EmailBody:
+    """
+    JSON body for params whose attachments carry raw bytes under "content".
+    Iterable (bytes chunks) with a len(), as requests expects of a streamed body.
+    """
+
+    def __init__(self, params):
+        params = dict(params)
+        self.attachments = []
+        placeholders = []
+        encoded = []
+        for attachment in params.get("attachments", ()):
+            token = f"@@{uuid.uuid4().hex}@@"
+            self.attachments.append(attachment["content"])
+            placeholders.append(token)
+            encoded.append(dict(attachment, content=token))
+        if encoded:
+            params["attachments"] = encoded
+        text = json.dumps(params, ensure_ascii=False)
+        self.parts = []  # JSON text between attachment contents
+        for token in placeholders:
+            head, text = text.split(token, 1)
+            self.parts.append(head.encode())
+        self.parts.append(text.encode())
+        self.length = sum(map(len, self.parts)) + sum(b64_length(len(a)) for a in self.attachments)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for part, data in zip(self.parts, self.attachments):
+            yield part
+            yield from b64_chunks(data)
+        yield self.parts[-1]
@@ -0,0 +1,167 @@
+# email_transports.py
+"""
+Pluggable email transports for send_report_email and the outbox sender.
+
+EMAIL_TRANSPORT=resend (default) posts to the Resend HTTP API, or to any
+Resend-compatible server when RESEND_API_URL is set (e.g.
+scripts/mock_email_server.py). EMAIL_TRANSPORT=mock accepts mail in-process:
+it sleeps for EMAIL_LATENCY (see llm_backends.parse_latency), fails a
+fraction of sends (EMAIL_ERROR_RATE retryable, EMAIL_REJECT_RATE permanent)
+and records a summary of every accepted message, so the outbox and the
+/process-form pipeline can be load-tested without sending real mail.
+
+Every transport has send(params, idempotency_key) -> message id and
+send_batch([params]) -> [message id]; both raise SendError on failure.
+"""
+import collections
+import json
+import os
+import random
+import threading
+import time
+import uuid
+
+from email_outbox import SendError
+from email_payload import EmailBody
+from llm_backends import parse_latency
+
+class EmailTransport:
+    """Interface: send(params, idempotency_key=None) and send_batch(params_list)."""
+    name = "base"
+
+    def send(self, params, idempotency_key=None):
+        raise NotImplementedError
+
+    def send_batch(self, params_list):
+        return [self.send(params) for params in params_list]
+
+class ResendTransport(EmailTransport):
+    """Resend HTTP API; attachments carry raw bytes and are base64-encoded while streaming."""
+    name = "resend"
+
+    def __init__(self, api_url="https://api.resend.com", api_key=None, timeout=30.0):
+        self.api_url = api_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def _post(self, path, body, idempotency_key=None):
+        import requests
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        try:
+            r = requests.post(f"{self.api_url}{path}", data=body, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            # connection errors and timeouts: the provider may be back on the next attempt
+            raise SendError(f"Resend request failed: {e}", retryable=True) from e
+        if r.status_code >= 500 or r.status_code in (408, 429):
+            raise SendError(f"Resend error {r.status_code}: {r.text[:500]}", retryable=True)
+        if r.status_code >= 400:
+            # any other 4xx (validation, auth, idempotency key conflicts) fails the same way every time
+            raise SendError(f"Resend error {r.status_code}: {r.text[:500]}", retryable=False)
+        return r.json()
+
+    def send(self, params, idempotency_key=None):
+        return self._post("/emails", EmailBody(params), idempotency_key)["id"]
+
+    def send_batch(self, params_list):
+        """Up to 100 emails without attachments in one call (Resend's batch API has no attachments)."""
+        body = json.dumps(params_list, ensure_ascii=False).encode()
+        return [item["id"] for item in self._post("/emails/batch", body)["data"]]
+
+def summarize(params, message_id, idempotency_key=None):
+    """What a stand-in keeps of a message: addressing and sizes, not the bodies."""
+    return {
+        "id": message_id,
+        "idempotency_key": idempotency_key,
+        "to": params.get("to"),
+        "subject": params.get("subject"),
+        "html_bytes": len(params.get("html", "").encode()),
+        "text_bytes": len(params.get("text", "").encode()),
+        "attachments": [
+            {"filename": a.get("filename"), "bytes": len(a.get("content", b""))}
+            for a in params.get("attachments", ())
+        ],
+        "at": time.time(),
+    }
+
+class MockTransport(EmailTransport):
+    """
+    In-process stand-in. Repeating an idempotency key returns the first
+    message id without recording a second message, as Resend does.
+    """
+    name = "mock"
+
+    def __init__(self, latency="0", error_rate=0.0, reject_rate=0.0, record_path=None, keep=1000):
+        self.sample_latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.reject_rate = reject_rate
+        self.record_path = record_path
+        self.messages = collections.deque(maxlen=keep)  # most recent summaries
+        self.counts = collections.Counter()
+        self._ids = {}  # idempotency key -> message id
+        self._lock = threading.Lock()
+
+    def _fail(self):
+        """Raise an injected failure, if this call draws one."""
+        roll = random.random()
+        if roll < self.reject_rate:
+            with self._lock:
+                self.counts["rejected"] += 1
+            raise SendError("Mock rejection (422)", retryable=False)
+        if roll < self.reject_rate + self.error_rate:
+            with self._lock:
+                self.counts["errors"] += 1
+            raise SendError("Mock rate limit (429)")
+
+    def _accept(self, params, idempotency_key=None):
+        with self._lock:
+            if idempotency_key in self._ids:
+                self.counts["duplicates"] += 1
+                return self._ids[idempotency_key]
+            message_id = str(uuid.uuid4())
+            if idempotency_key:
+                self._ids[idempotency_key] = message_id
+            summary = summarize(params, message_id, idempotency_key)
+            self.messages.append(summary)
+            self.counts["sent"] += 1
+            if self.record_path:
+                with open(self.record_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(summary) + "\n")
+        return message_id
+
+    def send(self, params, idempotency_key=None):
+        time.sleep(self.sample_latency())
+        self._fail()
+        return self._accept(params, idempotency_key)
+
+    def send_batch(self, params_list):
+        time.sleep(self.sample_latency())
+        self._fail()
+        return [self._accept(params) for params in params_list]
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counts)
+
+def get_email_transport():
+    """Build the transport selected by EMAIL_TRANSPORT and related env vars."""
+    kind = os.getenv("EMAIL_TRANSPORT", "resend").lower()
+    if kind == "resend":
+        return ResendTransport(
+            api_url=os.getenv("RESEND_API_URL", "https://api.resend.com"),
+            api_key=os.getenv("RESEND_API_KEY"),
+            timeout=float(os.getenv("EMAIL_TIMEOUT", "30"))
+        )
+    if kind == "mock":
+        return MockTransport(
+            latency=os.getenv("EMAIL_LATENCY", "0"),
+            error_rate=float(os.getenv("EMAIL_ERROR_RATE", "0")),
+            reject_rate=float(os.getenv("EMAIL_REJECT_RATE", "0")),
+            record_path=os.getenv("EMAIL_RECORD_PATH") or None
+        )
+    raise ValueError(f"Unknown EMAIL_TRANSPORT: {kind}")
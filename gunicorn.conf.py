@@ -0,0 +1,38 @@
+# gunicorn.conf.py
+# Picked up automatically by `gunicorn app:app` from the working directory.
+#
+# PRELOAD_APP=1 imports the app and builds shared read-only data once in the
+# master, then forks. Following the gc.freeze() recipe, collection is disabled
+# in the master, the heap is frozen right before each fork and collection is
+# re-enabled in the worker, so worker GC passes don't write to (and copy) the
+# shared pages.
+import gc
+import os
+
+preload_app = os.getenv("PRELOAD_APP") == "1"
+
+if preload_app:
+    gc.disable()
+
+def on_starting(server):
+    if preload_app:
+        from app import preload_shared_state
+        server.log.info("preloaded shared state in %ss", preload_shared_state())
+
+def pre_fork(server, worker):
+    if preload_app:
+        gc.freeze()
+
+def post_fork(server, worker):
+    """Warm each worker before it accepts requests (WARM_WORKERS=0 disables)."""
+    if preload_app:
+        gc.enable()
+        # the master's knowledge watcher thread did not survive the fork
+        from app import start_knowledge_watch
+        start_knowledge_watch()
+    if os.getenv("WARM_WORKERS", "1") != "1":
+        return
+    from app import warm_worker
+    state = warm_worker()
+    server.log.info("worker %s warm-up: %s in %ss %s", worker.pid, state["status"],
+                    state["seconds"], state["steps"])
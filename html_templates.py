@@ -0,0 +1,219 @@
+# html_templates.py
+"""
+Precompiled HTML templates.
+
+A template is an HTML file with {field} slots (CSS braces never match: a slot
+is a bare identifier in braces). It is parsed once, at import, into a tuple of
+static chunks and the slot names between them; render() escapes each value
+and joins the chunks in one pass, with no re-parsing or string concatenation
+per request. Values wrapped in Markup (e.g. knowledge_entries html fragments)
+are inserted as-is.
+
+  report.html   - the emailed report (render_report)
+  template.html - the blueprint layout filled from knowledge content
+
+The report is also compiled minified (render_report(document, minify=True)):
+whitespace between tags collapsed and the one shared <style> block reduced
+to compact, duplicate-free rules, so bulk emails upload less. size_report()
+breaks a rendered body down against Gmail's clipping limit.
+"""
+import os
+import re
+from collections import namedtuple
+
+from markupsafe import Markup, escape
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_SLOT = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+class HtmlTemplate:
+    __slots__ = ("name", "chunks", "slots", "fields")
+
+    def __init__(self, name, source):
+        self.name = name
+        self.chunks = _SLOT.split(source)  # static, field, static, field, ..., static
+        self.slots = tuple(self.chunks[1::2])
+        self.fields = frozenset(self.slots)
+
+    def render(self, **values):
+        escaped = {field: value if isinstance(value, Markup) else escape(value)  # once per value, not per slot
+                   for field, value in values.items()}
+        out = self.chunks.copy()
+        try:
+            out[1::2] = [escaped[field] for field in self.slots]
+        except KeyError as e:
+            raise KeyError(f"{self.name}: no value for {e.args[0]}") from None
+        return "".join(out)
+
+    def __repr__(self):
+        return f"<HtmlTemplate {self.name} fields={sorted(self.fields)}>"
+
+# ===== Minification =====
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_CSS_COMBINATOR = re.compile(r"\s*([,>+~])\s*")
+_CSS_COMMA = re.compile(r"\s*,\s*")  # values keep other spaces: calc() needs them around + and -
+_STYLE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S | re.I)
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_BLOCK_TAG = r"</?(?:html|head|meta|title|style|body|div|p|h[1-6]|br)\b[^>]*>"
+_BLOCK_EDGE = re.compile(rf"\s*({_BLOCK_TAG})\s*")
+
+def minify_css(css):
+    """Compact rules with exact repeats dropped (the later copy is kept, as it wins the cascade)."""
+    css = _CSS_COMMENT.sub("", css)
+    if "@" in css:  # at-rules nest braces; only collapse whitespace
+        return " ".join(css.split())
+    rules = []
+    for selector, body in _CSS_RULE.findall(css):
+        selector = _CSS_COMBINATOR.sub(r"\1", " ".join(selector.split()))
+        decls = []
+        for decl in body.split(";"):
+            prop, _, value = decl.partition(":")
+            if value.strip():
+                value = _CSS_COMMA.sub(",", " ".join(value.split()))
+                decls.append(f"{prop.strip()}:{value}")
+        rule = f"{selector}{{{';'.join(decls)}}}"
+        if rule in rules:
+            rules.remove(rule)
+        rules.append(rule)
+    return "".join(rules)
+
+def minify_html(source):
+    """
+    Minify a template's source (no <pre> or whitespace-sensitive content):
+    runs of whitespace become one space, and none is kept between tags or
+    next to block-level tags, where browsers do not render it.
+    """
+    styles = []
+
+    def stash(m):
+        styles.append(minify_css(m.group(2)))
+        return f"{m.group(1)}\0{m.group(3)}"
+
+    source = " ".join(_STYLE.sub(stash, source).split())
+    source = _BETWEEN_TAGS.sub("><", source)
+    source = _BLOCK_EDGE.sub(r"\1", source)
+    for css in styles:
+        source = source.replace("\0", css, 1)
+    return source
+
+def read_source(path):
+    """Template source; like Jinja, a single trailing newline is dropped."""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    return source[:-1] if source.endswith("\n") else source
+
+def load_template(path, name=None, minify=False, includes=None):
+    """
+    Compile an HTML file. includes maps a {slot} to the file whose source
+    replaces it at compile time (None: removed), so optional blocks cost
+    nothing per render.
+    """
+    source = read_source(path)
+    for slot, include in (includes or {}).items():
+        source = source.replace("{%s}" % slot, read_source(include) if include else "")
+    name = name or os.path.splitext(os.path.basename(path))[0]
+    if minify:
+        return HtmlTemplate(f"{name}.min", minify_html(source))
+    return HtmlTemplate(name, source)
+
+_REPORT_PATH = os.path.join(BASE_DIR, "report.html")
+_CHART_PATH = os.path.join(BASE_DIR, "chart_basics.html")
+# report.html with and without the chart essentials block, as written and minified
+REPORT_TEMPLATES = {
+    (chart, minify): load_template(_REPORT_PATH, "report" if chart else "report.nochart", minify,
+                                   {"chart_basics": _CHART_PATH if chart else None})
+    for chart in (True, False) for minify in (False, True)
+}
+REPORT_HTML = REPORT_TEMPLATES[True, False]
+BLUEPRINT_HTML = load_template(os.path.join(BASE_DIR, "template.html"), "blueprint")
+
+def escape_sections(sections):
+    """
+    [(header, [paragraph, ...])] with every string HTML-escaped. The texts
+    are escaped in a single escape() call, which is far cheaper than one call
+    per paragraph.
+    """
+    flat = []
+    for header, paragraphs in sections:
+        flat.append(header)
+        flat.extend(paragraphs)
+    escaped = iter(str(escape("\0".join(flat))).split("\0"))
+    return [(next(escaped), [next(escaped) for _ in paragraphs]) for _, paragraphs in sections]
+
+def render_sections(sections, separator="\n"):
+    """Markup for [(header, [paragraph, ...])] whose text is already escaped."""
+    return Markup(separator.join([
+        f"<div class='section'><h2>{header}</h2>{''.join([f'<p>{p}</p>' for p in paragraphs])}</div>"
+        for header, paragraphs in sections
+    ]))
+
+def sections_markup(sections, separator="\n"):
+    """
+    Same markup as render_sections(escape_sections(sections)), built as one
+    %-format skeleton filled from a single escape() call. Text that itself
+    contains "\\0" is escaped string by string instead.
+    """
+    flat, skeleton = [], []
+    for header, paragraphs in sections:
+        flat.append(header)
+        flat.extend(paragraphs)
+        skeleton.append("<div class='section'><h2>%s</h2>" + "<p>%s</p>" * len(paragraphs) + "</div>")
+    escaped = str(escape("\0".join(flat))).split("\0")
+    if len(escaped) != len(flat):
+        escaped = [escape(text) for text in flat]
+    return Markup(separator.join(skeleton) % tuple(escaped))
+
+def render_report(document, minify=False):
+    """report.html for a ReportDocument (report_document.py); the chart block is left out without a chart."""
+    chart = document.chart
+    sections = sections_markup(document.sections, "" if minify else "\n")
+    if not chart:
+        return REPORT_TEMPLATES[False, minify].render(first_name=document.first_name, sections=sections)
+    return REPORT_TEMPLATES[True, minify].render(
+        first_name=document.first_name,
+        sun_sign=chart['sun_sign'],
+        moon_sign=chart['moon_sign'],
+        rising_sign=chart['rising_sign'],
+        north_node_sign=chart['north_node']['sign'],
+        south_node_sign=chart['south_node']['sign'],
+        sections=sections,
+    )
+
+# ===== Size budget =====
+# Gmail clips HTML bodies past ~102 KB behind a "View entire message" link.
+GMAIL_CLIP_BYTES = 102 * 1024
+_TEXT = re.compile(r">([^<]+)<")
+
+SizeReport = namedtuple("SizeReport", "total style markup text budget over")
+
+def size_report(html, budget=GMAIL_CLIP_BYTES):
+    """UTF-8 bytes of an HTML body split into stylesheet, tags and text, against budget."""
+    total = len(html.encode())
+    style = sum(len(m.group(2).encode()) for m in _STYLE.finditer(html))
+    text = sum(len(t.encode()) for t in _TEXT.findall(_STYLE.sub(r"\1\3", html)))
+    return SizeReport(total, style, total - style - text, text, budget, total > budget)
+
+def _inline(value):
+    """A text field for a <p> slot: list fields read as a comma-separated phrase."""
+    return value if isinstance(value, str) else ", ".join(value)
+
+def blueprint_values(chart_data, entries, north_node_house):
+    """Slot values for template.html from chart signs and a KnowledgeEntries snapshot."""
+    sun, moon, rising = chart_data["sun_sign"], chart_data["moon_sign"], chart_data["rising_sign"]
+    north, south = chart_data["north_node"]["sign"], chart_data["south_node"]["sign"]
+    north_entry, south_entry = entries.north_nodes[north], entries.south_nodes[south]
+    house = entries.houses[int(north_node_house)]
+    return {
+        "sun_sign": sun, "moon_sign": moon, "rising_sign": rising,
+        "north_node_sign": north, "south_node_sign": south,
+        "north_node_house": north_node_house,
+        "north_node_meaning": north_entry.meaning,
+        "north_node_guidance_items": Markup(north_entry.html["guidance"]),
+        "south_node_patterns": south_entry.meaning,
+        "south_node_guidance_items": Markup(south_entry.html["guidance"]),
+        "house_meaning": house.meaning,
+        "sun_integration": _inline(entries.sun[sun].life_purpose),
+        "moon_integration": _inline(entries.moon[moon].emotional_needs),
+        "rising_integration": _inline(entries.rising[rising].approach_to_life),
+    }
@@ -0,0 +1,216 @@
+# knowledge_entries.py
+"""
+Typed, slots-based knowledge entries with render fragments built once at load.
+
+Every entry keeps its raw fields as attributes plus two precomputed maps:
+  html[field] - HTML-escaped markup (<p> per paragraph, <li> per list item)
+  rl[field]   - tuple of ReportLab Paragraph markup strings (XML-escaped,
+                one per paragraph or bulleted list item)
+so composing a report from the knowledge base is concatenation, with no
+dict traversal or escaping per request.
+
+CONTENT holds the current KnowledgeEntries snapshot. reload() builds and
+validates a complete new snapshot off to the side and swaps it in with one
+assignment, so readers see either the old or the new content, never a mix.
+Render caches that depend on knowledge content register with on_reload() and
+are cleared on a swap; nothing else is touched. watch() polls the source and
+compiled files so every worker process picks up edits on its own.
+"""
+import os
+import threading
+import time
+from html import escape as html_escape
+from types import MappingProxyType
+from xml.sax.saxutils import escape as xml_escape
+
+def _paragraphs(text):
+    return [p.strip() for p in text.split("\n\n") if p.strip()]
+
+def html_fragment(value):
+    if isinstance(value, str):
+        return "".join(f"<p>{html_escape(p)}</p>" for p in _paragraphs(value))
+    return "".join(f"<li>{html_escape(item)}</li>" for item in value)
+
+def rl_fragment(value):
+    if isinstance(value, str):
+        return tuple(xml_escape(p) for p in _paragraphs(value))
+    return tuple(f"&bull; {xml_escape(item)}" for item in value)
+
+class Entry:
+    """Base for typed entries; subclasses list their text FIELDS."""
+    FIELDS = ()
+    __slots__ = ("key", "html", "rl")
+
+    def __init__(self, key, data):
+        self.key = key
+        html, rl = {}, {}
+        for field in self.FIELDS:
+            value = data[field]
+            if isinstance(value, list):
+                value = tuple(value)
+            setattr(self, field, value)
+            html[field] = html_fragment(value)
+            rl[field] = rl_fragment(value)
+        self.html = MappingProxyType(html)
+        self.rl = MappingProxyType(rl)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.key!r}>"
+
+class SunEntry(Entry):
+    FIELDS = ("core_traits", "life_purpose", "strengths", "challenges")
+    __slots__ = FIELDS
+
+class MoonEntry(Entry):
+    FIELDS = ("emotional_nature", "emotional_needs", "stress_patterns", "healing_practices")
+    __slots__ = FIELDS
+
+class RisingEntry(Entry):
+    FIELDS = ("first_impression", "outer_personality", "approach_to_life", "personal_style")
+    __slots__ = FIELDS
+
+class NodeEntry(Entry):
+    FIELDS = ("meaning", "guidance")
+    __slots__ = FIELDS
+
+class HouseEntry(Entry):
+    FIELDS = ("meaning", "guidance")
+    __slots__ = FIELDS
+
+class CombinationEntry(Entry):
+    FIELDS = ("north_meaning", "north_guidance_sign", "north_guidance_house",
+              "south_patterns", "south_guidance", "combined_insight")
+    __slots__ = FIELDS + ("north_sign", "north_house", "south_sign", "south_house")
+
+    def __init__(self, key, data):
+        super().__init__(key, data)
+        self.north_sign = data["north_sign"]
+        self.north_house = data["north_house"]
+        self.south_sign = data["south_sign"]
+        self.south_house = data["south_house"]
+
+class KnowledgeEntries:
+    """All entries of one knowledge store, typed, pre-rendered and read-only."""
+    __slots__ = ("version", "sun", "moon", "rising", "north_nodes", "south_nodes",
+                 "houses", "combinations")
+
+    def __init__(self, store):
+        self.version = store.version
+
+        def build(section, cls):
+            return MappingProxyType({k: cls(k, store.get(section, k)) for k in store.keys(section)})
+
+        self.sun = build("sun_signs", SunEntry)
+        self.moon = build("moon_signs", MoonEntry)
+        self.rising = build("rising_signs", RisingEntry)
+        self.north_nodes = build("north_nodes", NodeEntry)
+        self.south_nodes = build("south_nodes", NodeEntry)
+        self.houses = build("houses", HouseEntry)
+        combinations = {}
+        for key in store.keys("north_node_combinations"):
+            entry = CombinationEntry(key, store.get("north_node_combinations", key))
+            combinations[(entry.north_sign, entry.north_house)] = entry
+        self.combinations = MappingProxyType(combinations)
+
+    def combination(self, north_sign, north_house):
+        return self.combinations.get((north_sign, north_house))
+
+# ===== Versioned content =====
+class ContentStore:
+    def __init__(self):
+        self._current = None
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._watcher = None
+        self._watcher_pid = None
+        self._watch_lock = threading.Lock()
+
+    def current(self):
+        """The live KnowledgeEntries snapshot, built on first use."""
+        entries = self._current
+        if entries is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = self._build(fresh=False)
+                entries = self._current
+        return entries
+
+    @property
+    def version(self):
+        return self.current().version
+
+    def on_reload(self, fn):
+        """Register fn(old_version, new_version), called after each swap."""
+        self._listeners.append(fn)
+        return fn
+
+    def _build(self, fresh):
+        from knowledge_store import open_knowledge_store
+        store = open_knowledge_store(fresh=fresh)
+        if store.index is not None and store.index.errors:
+            raise ValueError(f"knowledge content {store.version} has {len(store.index.errors)} "
+                             f"validation errors, first: {store.index.errors[0].message}")
+        entries = KnowledgeEntries(store)
+        if hasattr(store, "close"):
+            store.close()  # entries hold copies; don't keep SQLite handles open (e.g. across fork)
+        return entries
+
+    def reload(self, force=False):
+        """
+        Rebuild from disk and swap if the content version changed (or force).
+        Returns (changed, version). Invalid content raises ValueError and the
+        current snapshot stays live.
+        """
+        with self._lock:
+            old = self._current
+            new = self._build(fresh=True)
+            if old is not None and old.version == new.version and not force:
+                return False, old.version
+            self._current = new
+        old_version = old.version if old is not None else None
+        for fn in list(self._listeners):
+            try:
+                fn(old_version, new.version)
+            except Exception as e:
+                print("[knowledge_entries] reload listener failed:", e)
+        print(f"[knowledge_entries] knowledge content {old_version} -> {new.version}")
+        return True, new.version
+
+    def watch(self, interval=2.0):
+        """
+        Start a daemon thread that reloads when knowledge files change. Threads
+        don't survive fork, so a forked worker calling this starts its own.
+        """
+        from knowledge_store import KB_SOURCE_PATH, KNOWLEDGE_DB_PATH
+
+        def mtimes():
+            return tuple(os.path.getmtime(p) if os.path.exists(p) else None
+                         for p in (KB_SOURCE_PATH, KNOWLEDGE_DB_PATH))
+
+        def loop():
+            seen = mtimes()
+            while True:
+                time.sleep(interval)
+                now = mtimes()
+                if now == seen:
+                    continue
+                seen = now
+                if self._current is None:
+                    continue  # nothing built yet; first use reads the new files
+                try:
+                    self.reload()
+                except Exception as e:
+                    print("[knowledge_entries] reload failed, keeping current content:", e)
+
+        with self._watch_lock:
+            if self._watcher is None or self._watcher_pid != os.getpid():
+                self._watcher = threading.Thread(target=loop, name="knowledge-watch", daemon=True)
+                self._watcher.start()
+                self._watcher_pid = os.getpid()
+            return self._watcher
+
+CONTENT = ContentStore()
+
+def get_entries():
+    """Current process-wide KnowledgeEntries."""
+    return CONTENT.current()
@@ -0,0 +1,104 @@
+# knowledge_fragments.py
+"""
+Deduplicated storage for knowledge base text.
+
+Combination entries repeat the same sign and house sentences many times (the
+Aries north_meaning opening appears in all twelve Aries houses). Strings are
+split at sentence and paragraph boundaries, each distinct fragment is stored
+once in a FragmentTable, and entries keep tuples of fragment ids. Joining the
+fragments back reproduces the original text byte for byte.
+
+Encoded entries map field -> (tag, payload): (TEXT, ids) for a str,
+(TEXT_LIST, [ids, ...]) for a list of str and (RAW, value) for anything else,
+so a value that merely looks like ids (e.g. a list of ints) is never decoded.
+The pairs come back from JSON as two-element lists, which decode the same.
+"""
+import re
+from collections.abc import Mapping
+
+# Separators are captured so they become fragments too and decoding is a plain join.
+_SPLIT_RE = re.compile(r"(?<=[.!?])( |\n\n)")
+
+# Tags for encoded entry values
+TEXT, TEXT_LIST, RAW = "s", "l", "v"
+
+class FragmentTable:
+    def __init__(self, fragments=()):
+        self.fragments = list(fragments)
+        self._ids = {f: i for i, f in enumerate(self.fragments)}
+
+    def __len__(self):
+        return len(self.fragments)
+
+    def intern(self, text):
+        fid = self._ids.get(text)
+        if fid is None:
+            fid = self._ids[text] = len(self.fragments)
+            self.fragments.append(text)
+        return fid
+
+    def encode(self, text):
+        return tuple(self.intern(part) for part in _SPLIT_RE.split(text))
+
+    def decode(self, ids):
+        frags = self.fragments
+        return "".join([frags[i] for i in ids])
+
+    def encode_entry(self, entry):
+        out = {}
+        for field, value in entry.items():
+            if isinstance(value, str):
+                out[field] = (TEXT, self.encode(value))
+            elif isinstance(value, list) and value and all(isinstance(v, str) for v in value):
+                out[field] = (TEXT_LIST, [self.encode(v) for v in value])
+            else:
+                out[field] = (RAW, value)
+        return out
+
+    def decode_entry(self, encoded):
+        out = {}
+        for field, (tag, payload) in encoded.items():
+            if tag == TEXT:
+                out[field] = self.decode(payload)
+            elif tag == TEXT_LIST:
+                out[field] = [self.decode(ids) for ids in payload]
+            elif tag == RAW:
+                out[field] = payload
+            else:
+                raise ValueError(f"unknown fragment tag {tag!r} for field {field!r}")
+        return out
+
+class NormalizedSection(Mapping):
+    """
+    Read-only mapping of key -> entry that keeps only encoded entries and
+    composes the text dicts on access.
+    """
+
+    def __init__(self, table, encoded):
+        self.table = table
+        self._encoded = encoded
+
+    @classmethod
+    def from_entries(cls, entries, table=None):
+        table = table if table is not None else FragmentTable()
+        return cls(table, {k: table.encode_entry(v) for k, v in entries.items()})
+
+    def __getitem__(self, key):
+        return self.table.decode_entry(self._encoded[key])
+
+    def __iter__(self):
+        return iter(self._encoded)
+
+    def __len__(self):
+        return len(self._encoded)
+
+def fragment_stats(entries, table):
+    """(original chars, stored fragment chars) for a section, for build reports."""
+    original = 0
+    for entry in entries.values():
+        for value in entry.values():
+            if isinstance(value, str):
+                original += len(value)
+            elif isinstance(value, list):
+                original += sum(len(v) for v in value if isinstance(v, str))
+    return original, sum(len(f) for f in table.fragments)
@@ -0,0 +1,155 @@
+# knowledge_store.py
+"""
+On-demand access to the knowledge base.
+
+scripts/build_knowledge_db.py compiles knowledge_base.py into an indexed SQLite
+file (one row per entry). Entry text is stored as ids into one table of
+deduplicated sentence fragments (see knowledge_fragments.py). KnowledgeStore
+reads single entries on first use and composes their text, so importing this
+module does not parse or materialize the whole corpus.
+When the compiled file is missing or older than knowledge_base.py,
+open_knowledge_store() falls back to importing the dict literal.
+
+Returned entries are shared between callers; treat them as read-only.
+"""
+import hashlib
+import json
+import os
+import runpy
+import sqlite3
+import threading
+
+from knowledge_fragments import FragmentTable
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+KB_SOURCE_PATH = os.path.join(BASE_DIR, "knowledge_base.py")
+KNOWLEDGE_DB_PATH = os.getenv("KNOWLEDGE_DB_PATH", os.path.join(BASE_DIR, "knowledge_base.db"))
+DB_FORMAT = "3"
+
+def content_version(path=KB_SOURCE_PATH):
+    """Stable short hash of the knowledge base source."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+def encode_key(key):
+    # JSON keeps int house numbers distinct from sign names
+    return json.dumps(key)
+
+class KnowledgeStore:
+    """Read-only, thread-safe view over a compiled knowledge base file."""
+
+    def __init__(self, db_path=KNOWLEDGE_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._memo = {}
+        self._table = None
+        self.index = None
+        meta = dict(self._conn().execute("SELECT key, value FROM meta"))
+        if meta.get("format") != DB_FORMAT:
+            raise ValueError(f"{db_path}: unsupported knowledge db format {meta.get('format')!r}")
+        self.version = meta.get("content_version")
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():  # never reuse a connection across fork
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro&immutable=1", uri=True,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA mmap_size=16777216")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self):
+        """Close this thread's connection; entries already fetched stay usable."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def fragments(self):
+        """The shared fragment table, loaded on first entry access."""
+        if self._table is None:
+            rows = self._conn().execute("SELECT text FROM fragments ORDER BY id")
+            self._table = FragmentTable(r[0] for r in rows)
+        return self._table
+
+    def get(self, section, key, default=None):
+        memo_key = (section, key)
+        entry = self._memo.get(memo_key)
+        if entry is not None:
+            return entry
+        row = self._conn().execute(
+            "SELECT body FROM entries WHERE section = ? AND key = ?", (section, encode_key(key))
+        ).fetchone()
+        if row is None:
+            return default
+        entry = self._memo[memo_key] = self.fragments().decode_entry(json.loads(row[0]))
+        return entry
+
+    def keys(self, section):
+        rows = self._conn().execute(
+            "SELECT key FROM entries WHERE section = ? ORDER BY position", (section,)
+        )
+        return [json.loads(r[0]) for r in rows]
+
+    def sections(self):
+        rows = self._conn().execute("SELECT DISTINCT section FROM entries ORDER BY section")
+        return [r[0] for r in rows]
+
+    def section(self, section):
+        """Materialize one whole section as a dict."""
+        return {k: self.get(section, k) for k in self.keys(section)}
+
+def load_source_dict(path=KB_SOURCE_PATH):
+    """Execute knowledge_base.py afresh, bypassing the sys.modules copy."""
+    return runpy.run_path(path)["KNOWLEDGE_BASE"]
+
+class DictKnowledgeStore:
+    """Same interface over the in-memory KNOWLEDGE_BASE dict."""
+
+    def __init__(self, knowledge_base=None, version=None):
+        if knowledge_base is None:
+            from knowledge_base import KNOWLEDGE_BASE as knowledge_base
+        self._kb = knowledge_base
+        self.version = version
+        self.index = None
+
+    def get(self, section, key, default=None):
+        return self._kb.get(section, {}).get(key, default)
+
+    def keys(self, section):
+        return list(self._kb.get(section, {}))
+
+    def sections(self):
+        return sorted(self._kb)
+
+    def section(self, section):
+        return self._kb.get(section, {})
+
+def open_knowledge_store(db_path=KNOWLEDGE_DB_PATH, validate=True, fresh=False):
+    """
+    Compiled store when it is present and current, otherwise the source dict.
+    With validate=True the store gets an .index (knowledge_validation.KnowledgeIndex)
+    validated once per content version. fresh=True re-reads knowledge_base.py
+    from disk instead of using the already imported module (for reloads).
+    """
+    store = _open_store(db_path, fresh)
+    if validate:
+        from knowledge_validation import load_index
+        store.index = load_index(store)
+    return store
+
+def _open_store(db_path, fresh=False):
+    source_version = content_version() if os.path.exists(KB_SOURCE_PATH) else None
+    if os.path.exists(db_path):
+        try:
+            store = KnowledgeStore(db_path)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"[knowledge_store] cannot use {db_path}: {e}. Using knowledge_base.py.")
+        else:
+            if source_version is None or store.version == source_version:
+                return store
+            print(f"[knowledge_store] {db_path} is stale ({store.version} != {source_version}); "
+                  "run scripts/build_knowledge_db.py. Using knowledge_base.py.")
+    knowledge_base = load_source_dict() if fresh else None
+    return DictKnowledgeStore(knowledge_base, version=source_version)
@@ -0,0 +1,272 @@
+# knowledge_validation.py
+"""
+Integrity checks for the knowledge base and a validated (sign, house) index.
+
+Source checks read knowledge_base.py itself, because a dict literal silently
+keeps only the last of two duplicate keys and Python silently joins adjacent
+string literals when a comma is missing. Structure checks walk a knowledge
+store (compiled or dict) and report missing, extra and malformed entries.
+
+load_index() runs the checks once per content version and caches the result
+as JSON (KB_INDEX_CACHE_DIR, default the system temp dir), so worker boots
+reuse the validated index instead of re-validating.
+"""
+import ast
+import json
+import os
+import re
+import tempfile
+import tokenize
+from collections import Counter, namedtuple
+
+from knowledge_store import KB_SOURCE_PATH, content_version
+
+KB_INDEX_CACHE_DIR = os.getenv("KB_INDEX_CACHE_DIR", tempfile.gettempdir())
+INDEX_FORMAT = 1
+
+SIGNS = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+)
+HOUSES = tuple(range(1, 13))
+
+# section -> {field: type}
+SIGN_SECTION_FIELDS = {
+    "sun_signs": {"core_traits": str, "life_purpose": str, "strengths": list, "challenges": list},
+    "moon_signs": {"emotional_nature": str, "emotional_needs": list,
+                   "stress_patterns": list, "healing_practices": list},
+    "rising_signs": {"first_impression": str, "outer_personality": list,
+                     "approach_to_life": list, "personal_style": list},
+    "north_nodes": {"meaning": str, "guidance": list},
+    "south_nodes": {"meaning": str, "guidance": list},
+}
+HOUSE_FIELDS = {"meaning": str, "guidance": list}
+COMBINATION_FIELDS = {
+    "north_sign": str, "north_house": int, "south_sign": str, "south_house": int,
+    "north_meaning": str, "north_guidance_sign": list, "north_guidance_house": list,
+    "south_patterns": str, "south_guidance": list, "combined_insight": str,
+}
+
+# A sentence end running straight into the next sentence, as left by a missing comma
+_MERGED_RE = re.compile(r"[a-z][.!?][A-Z]")
+
+Issue = namedtuple("Issue", "level section key message")
+ComboRef = namedtuple("ComboRef", "key north_sign north_house south_sign south_house")
+
+def opposite_sign(sign):
+    return SIGNS[(SIGNS.index(sign) + 6) % 12]
+
+def opposite_house(house):
+    return (house + 5) % 12 + 1
+
+def combination_key(sign, house):
+    return f"{sign.lower()}_{house}"
+
+# ===== Source checks =====
+def check_source(path=KB_SOURCE_PATH):
+    """Duplicate dict keys and implicit string concatenation in the source file."""
+    issues = []
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+
+    for node in ast.walk(ast.parse(source, path)):
+        if not isinstance(node, ast.Dict):
+            continue
+        seen = {}
+        for k in node.keys:
+            if not isinstance(k, ast.Constant):
+                continue
+            if k.value in seen:
+                issues.append(Issue("error", "source", k.value,
+                                    f"duplicate key on line {k.lineno} (first on line {seen[k.value]}); "
+                                    "the earlier value is discarded"))
+            else:
+                seen[k.value] = k.lineno
+
+    with open(path, encoding="utf-8") as f:
+        tokens = [t for t in tokenize.generate_tokens(f.readline)
+                  if t.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT)]
+    for a, b in zip(tokens, tokens[1:]):
+        if a.type == tokenize.STRING and b.type == tokenize.STRING:
+            issues.append(Issue("error", "source", None,
+                                f"implicit string concatenation on lines {a.start[0]}-{b.start[0]} "
+                                "(missing comma?)"))
+    return issues
+
+# ===== Structure checks =====
+def _check_fields(section, key, entry, fields, issues):
+    if not isinstance(entry, dict):
+        issues.append(Issue("error", section, key, "entry is not a dict"))
+        return
+    for field, ftype in fields.items():
+        if field not in entry:
+            issues.append(Issue("error", section, key, f"missing field {field!r}"))
+            continue
+        value = entry[field]
+        if not isinstance(value, ftype):
+            issues.append(Issue("error", section, key,
+                                f"{field!r} is {type(value).__name__}, expected {ftype.__name__}"))
+        elif ftype is str and not value.strip():
+            issues.append(Issue("error", section, key, f"{field!r} is empty"))
+        elif ftype is list:
+            if not value or not all(isinstance(v, str) and v.strip() for v in value):
+                issues.append(Issue("error", section, key, f"{field!r} must be a non-empty list of strings"))
+            for item in value:
+                if isinstance(item, str) and _MERGED_RE.search(item):
+                    issues.append(Issue("warning", section, key,
+                                        f"{field!r} item looks like two merged items: {item[:60]!r}"))
+    for field in entry:
+        if field not in fields:
+            issues.append(Issue("warning", section, key, f"unexpected field {field!r}"))
+
+def _check_list_lengths(section, entries, issues):
+    """Flag list fields whose length differs from the section norm (e.g. two items merged)."""
+    lengths = {}
+    for key, entry in entries.items():
+        if isinstance(entry, dict):
+            for field, value in entry.items():
+                if isinstance(value, list):
+                    lengths.setdefault(field, Counter())[len(value)] += 1
+    for field, counts in lengths.items():
+        norm = counts.most_common(1)[0][0]
+        for key, entry in entries.items():
+            value = entry.get(field) if isinstance(entry, dict) else None
+            if isinstance(value, list) and len(value) != norm:
+                issues.append(Issue("warning", section, key,
+                                    f"{field!r} has {len(value)} items, most entries have {norm}"))
+
+def check_structure(store):
+    """Validate a knowledge store and build the (sign, house) combination index."""
+    issues = []
+    sections = set(store.sections())
+
+    expected = dict.fromkeys(SIGN_SECTION_FIELDS, SIGNS)
+    expected["houses"] = HOUSES
+    for section, keys in expected.items():
+        if section not in sections:
+            issues.append(Issue("error", section, None, "section missing"))
+            continue
+        present = store.keys(section)
+        for key in keys:
+            if key not in present:
+                issues.append(Issue("error", section, key, "entry missing"))
+        for key in present:
+            if key not in keys:
+                issues.append(Issue("warning", section, key, "unexpected entry"))
+        fields = HOUSE_FIELDS if section == "houses" else SIGN_SECTION_FIELDS[section]
+        entries = {k: store.get(section, k) for k in present}
+        for key, entry in entries.items():
+            _check_fields(section, key, entry, fields, issues)
+        _check_list_lengths(section, entries, issues)
+
+    index = {}
+    section = "north_node_combinations"
+    if section not in sections:
+        issues.append(Issue("error", section, None, "section missing"))
+        return issues, index
+    present = set(store.keys(section))
+    entries = {}
+    for sign in SIGNS:
+        for house in HOUSES:
+            key = combination_key(sign, house)
+            entry = store.get(section, key)
+            if entry is None:
+                issues.append(Issue("error", section, key, "entry missing"))
+                continue
+            entries[key] = entry
+            _check_fields(section, key, entry, COMBINATION_FIELDS, issues)
+            if not isinstance(entry, dict):
+                continue
+            want = {"north_sign": sign, "north_house": house,
+                    "south_sign": opposite_sign(sign), "south_house": opposite_house(house)}
+            for field, value in want.items():
+                if field in entry and entry[field] != value:
+                    issues.append(Issue("error", section, key,
+                                        f"{field!r} is {entry[field]!r}, expected {value!r}"))
+            index[(sign, house)] = ComboRef(key, sign, house, opposite_sign(sign), opposite_house(house))
+    for key in sorted(present - set(entries)):
+        issues.append(Issue("warning", section, key, "unexpected entry"))
+    _check_list_lengths(section, entries, issues)
+    return issues, index
+
+# ===== Validated index =====
+class KnowledgeIndex:
+    """Validation result for one content version plus the (sign, house) index."""
+
+    def __init__(self, version, combinations, issues):
+        self.version = version
+        self.combinations = combinations
+        self.issues = issues
+
+    @property
+    def errors(self):
+        return [i for i in self.issues if i.level == "error"]
+
+    def combination(self, sign, house):
+        """ComboRef for a North Node sign and house, or None."""
+        return self.combinations.get((sign, house))
+
+    def to_json(self):
+        return {
+            "format": INDEX_FORMAT,
+            "version": self.version,
+            "combinations": [list(ref) for ref in self.combinations.values()],
+            "issues": [list(i) for i in self.issues],
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        refs = [ComboRef(*r) for r in data["combinations"]]
+        return cls(
+            data["version"],
+            {(r.north_sign, r.north_house): r for r in refs},
+            [Issue(*i) for i in data["issues"]],
+        )
+
+def validate(store, source_path=KB_SOURCE_PATH):
+    issues = check_source(source_path) if source_path and os.path.exists(source_path) else []
+    structure_issues, combinations = check_structure(store)
+    version = store.version or (content_version(source_path) if source_path else None)
+    return KnowledgeIndex(version, combinations, issues + structure_issues)
+
+def index_cache_path(version):
+    return os.path.join(KB_INDEX_CACHE_DIR, f"kb_index_{version}.json")
+
+def load_index(store, source_path=KB_SOURCE_PATH):
+    """Validated index for the store's content version, from cache when possible."""
+    version = store.version
+    if version:
+        path = index_cache_path(version)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") == INDEX_FORMAT and data.get("version") == version:
+                return KnowledgeIndex.from_json(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    index = validate(store, source_path)
+    for issue in index.issues:
+        print(f"[knowledge_validation] {issue.level}: {issue.section}/{issue.key}: {issue.message}")
+    if version:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index.to_json(), f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[knowledge_validation] could not cache index at {path}: {e}")
+    return index
+
+def main():
+    """CLI: validate knowledge_base.py and exit non-zero on errors."""
+    from knowledge_store import open_knowledge_store
+    index = validate(open_knowledge_store())
+    for issue in index.issues:
+        print(f"{issue.level}: {issue.section}/{issue.key}: {issue.message}")
+    print(f"{len(index.combinations)} combinations indexed, "
+          f"{len(index.errors)} errors, {len(index.issues) - len(index.errors)} warnings")
+    return 1 if index.errors else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
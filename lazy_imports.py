@@ -0,0 +1,68 @@
+# lazy_imports.py
+"""
+Deferred imports for heavy dependencies.
+
+lazy_import("swisseph") returns a stand-in that imports the real module on
+first attribute access, runs an optional on_load(module) setup hook once, and
+records how long the import took. Routes that never touch a dependency
+(/test, /ping) never pay for it. warm_up() forces every registered module in,
+e.g. from a server hook before traffic arrives.
+"""
+import importlib
+import threading
+import time
+
+_registry = {}
+IMPORT_TIMES = {}  # module name -> seconds spent importing on first use
+
+class LazyModule:
+    __slots__ = ("_name", "_on_load", "_module", "_lock")
+
+    def __init__(self, name, on_load=None):
+        self._name = name
+        self._on_load = on_load
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    if self._on_load is not None:
+                        self._on_load(module)
+                    IMPORT_TIMES[self._name] = time.perf_counter() - start
+                    self._module = module
+        return module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name} ({state})>"
+
+def lazy_import(name, on_load=None):
+    """Register (or return the already registered) lazy stand-in for name."""
+    mod = _registry.get(name)
+    if mod is None:
+        mod = _registry[name] = LazyModule(name, on_load)
+    return mod
+
+def warm_up(names=None):
+    """Import registered modules now (all of them by default); returns IMPORT_TIMES."""
+    for name, mod in list(_registry.items()):
+        if names is None or name in names:
+            mod._load()
+    return dict(IMPORT_TIMES)
+
+def import_status():
+    """{module: seconds or None if not imported yet} for every registered module."""
+    return {name: (IMPORT_TIMES.get(name) if mod.loaded else None) for name, mod in _registry.items()}
@@ -0,0 +1,249 @@
+# llm_backends.py
+"""
+Pluggable completion backends for generate_ai_report.
+
+LLM_BACKEND=openai (default) calls OpenAI, or any OpenAI-compatible server when
+LLM_API_BASE is set (e.g. scripts/mock_llm_server.py). LLM_BACKEND=mock answers
+in-process from recorded fixtures or synthetic SECTION: text, with LLM_LATENCY
+controlling the simulated delay.
+
+complete() returns a Completion carrying token counts and timings so callers
+can record prompt size, output size, time-to-first-token and latency.
+"""
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import namedtuple
+
+SECTION_RE = re.compile(r"^SECTION:\s*(.+?)\s*$", re.MULTILINE)
+
+# ===== Completion / Tokens =====
+# ttft and latency are seconds; ttft is None when the backend cannot observe it.
+Completion = namedtuple("Completion", "text prompt_tokens completion_tokens ttft latency")
+
+# USD per 1K tokens (prompt, completion). AI_PRICE_PER_1K="p,c" overrides.
+MODEL_PRICES = {
+    "gpt-4": (0.03, 0.06),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+}
+
+_encoders = {}
+
+def count_tokens(text, model="gpt-4"):
+    """Token count via tiktoken when installed, otherwise ~4 characters per token."""
+    enc = _encoders.get(model)
+    if enc is None:
+        try:
+            import tiktoken
+            enc = tiktoken.encoding_for_model(model)
+        except Exception:
+            enc = False
+        _encoders[model] = enc
+    if enc:
+        return len(enc.encode(text))
+    return max(1, len(text) // 4)
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    override = os.getenv("AI_PRICE_PER_1K")
+    if override:
+        prices = tuple(float(p) for p in override.split(","))
+    else:
+        prices = MODEL_PRICES.get(model, MODEL_PRICES["gpt-4"])
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1000.0
+
+# ===== Latency =====
+def parse_latency(spec):
+    """
+    Build a sampler returning seconds from a spec string:
+      "0"                 no delay
+      "fixed:800"         constant 800 ms
+      "uniform:200,1500"  uniform between 200 and 1500 ms
+      "normal:900,250"    gaussian mean/stddev ms, clipped at 0
+      "lognormal:900,0.5" lognormal with median 900 ms and sigma 0.5
+    """
+    spec = (spec or "0").strip()
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    vals = [float(a) for a in args.split(",") if a.strip()]
+    if kind == "fixed":
+        ms = vals[0] if vals else 0.0
+        return lambda: ms / 1000.0
+    if kind == "uniform":
+        lo, hi = vals
+        return lambda: random.uniform(lo, hi) / 1000.0
+    if kind == "normal":
+        mu, sd = vals
+        return lambda: max(0.0, random.gauss(mu, sd)) / 1000.0
+    if kind == "lognormal":
+        median, sigma = vals
+        mu = math.log(median)
+        return lambda: random.lognormvariate(mu, sigma) / 1000.0
+    raise ValueError(f"Unknown latency spec: {spec}")
+
+# ===== Fixtures =====
+def prompt_digest(prompt):
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+class FixtureStore:
+    """
+    Recorded completions in JSONL, one {"prompt_sha256", "completion"} per line.
+    lookup() returns the exact match for a prompt if recorded, otherwise the
+    next recording in round-robin order, or None when the store is empty.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.by_digest = {}
+        self.records = []
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    rec = json.loads(line)
+                    self.records.append(rec["completion"])
+                    if rec.get("prompt_sha256"):
+                        self.by_digest[rec["prompt_sha256"]] = rec["completion"]
+        self._cycle = itertools.cycle(self.records) if self.records else None
+        self._lock = threading.Lock()
+
+    def lookup(self, prompt):
+        hit = self.by_digest.get(prompt_digest(prompt))
+        if hit is not None or self._cycle is None:
+            return hit
+        with self._lock:
+            return next(self._cycle)
+
+    def record(self, prompt, completion):
+        if not self.path:
+            return
+        line = json.dumps({"prompt_sha256": prompt_digest(prompt), "completion": completion})
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+# ===== Synthetic text =====
+_SENTENCES = [
+    "This placement asks for steady attention and honest self-observation",
+    "Growth arrives through small repeated choices rather than dramatic leaps",
+    "Notice where familiar habits offer comfort but no longer offer progress",
+    "Relationships mirror this theme and reward clear, kind communication",
+    "Trust the quieter signals of the body as much as the mind",
+    "Practical routines turn insight into lasting change",
+]
+
+def synthetic_completion(prompt, paragraphs=2, sentences=3):
+    """Produce SECTION:-formatted filler using the section headers found in prompt."""
+    headers = SECTION_RE.findall(prompt) or ["Your Personal Report"]
+    rnd = random.Random(prompt_digest(prompt))
+    out = []
+    for header in headers:
+        out.append(f"SECTION: {header}")
+        for _ in range(paragraphs):
+            out.append(". ".join(rnd.sample(_SENTENCES, sentences)) + ".")
+        out.append("")
+    return "\n".join(out).strip()
+
+# ===== Backends =====
+class LLMBackend:
+    """Interface: complete(prompt, ...) returns a Completion."""
+    name = "base"
+
+    def complete(self, prompt, model="gpt-4", max_tokens=2000, temperature=0.7):
+        raise NotImplementedError
+
+class OpenAIBackend(LLMBackend):
+    """
+    OpenAI Chat Completions. api_base points it at a compatible stand-in.
+    With stream=True the response is streamed so time-to-first-token can be
+    measured; completion tokens are then counted from the streamed deltas.
+    """
+    name = "openai"
+
+    def __init__(self, api_base=None, record_path=None, stream=True):
+        self.api_base = api_base
+        self.recorder = FixtureStore(record_path) if record_path else None
+        self.stream = stream
+
+    def complete(self, prompt, model="gpt-4", max_tokens=2000, temperature=0.7):
+        import openai
+        if not openai.api_key:
+            openai.api_key = os.getenv("OPENAI_API_KEY")
+        kwargs = {}
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
+            kwargs["api_key"] = openai.api_key or "mock"
+        start = time.perf_counter()
+        resp = openai.ChatCompletion.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=self.stream,
+            **kwargs
+        )
+        if self.stream:
+            ttft, parts = None, []
+            for chunk in resp:
+                delta = chunk.choices[0].get("delta", {}).get("content")
+                if delta:
+                    if ttft is None:
+                        ttft = time.perf_counter() - start
+                    parts.append(delta)
+            raw = "".join(parts)
+            prompt_tokens = count_tokens(prompt, model)
+            completion_tokens = len(parts)
+        else:
+            ttft = None
+            raw = resp.choices[0].message.content
+            usage = resp.get("usage") or {}
+            prompt_tokens = usage.get("prompt_tokens") or count_tokens(prompt, model)
+            completion_tokens = usage.get("completion_tokens") or count_tokens(raw, model)
+        latency = time.perf_counter() - start
+        text = raw.strip()
+        if self.recorder:
+            self.recorder.record(prompt, text)
+        return Completion(text, prompt_tokens, completion_tokens, ttft, latency)
+
+class MockBackend(LLMBackend):
+    """In-process stand-in: recorded fixtures first, synthetic text otherwise."""
+    name = "mock"
+
+    def __init__(self, fixtures_path=None, latency="0"):
+        self.fixtures = FixtureStore(fixtures_path)
+        self.sample_latency = parse_latency(latency)
+
+    def complete(self, prompt, model="gpt-4", max_tokens=2000, temperature=0.7):
+        start = time.perf_counter()
+        time.sleep(self.sample_latency())
+        text = self.fixtures.lookup(prompt)
+        if text is None:
+            text = synthetic_completion(prompt)
+        latency = time.perf_counter() - start
+        return Completion(text, count_tokens(prompt, model), count_tokens(text, model), latency, latency)
+
+def get_llm_backend():
+    """Build the backend selected by LLM_BACKEND and related env vars."""
+    kind = os.getenv("LLM_BACKEND", "openai").lower()
+    if kind == "openai":
+        return OpenAIBackend(
+            api_base=os.getenv("LLM_API_BASE") or None,
+            record_path=os.getenv("LLM_RECORD_PATH") or None,
+            stream=os.getenv("LLM_STREAM", "1") == "1"
+        )
+    if kind == "mock":
+        return MockBackend(
+            fixtures_path=os.getenv("LLM_FIXTURES_PATH") or None,
+            latency=os.getenv("LLM_LATENCY", "0")
+        )
+    raise ValueError(f"Unknown LLM_BACKEND: {kind}")
@@ -0,0 +1,73 @@
+# metrics.py
+"""
+Minimal in-process metrics exported in Prometheus text format at /metrics.
+Each worker process keeps its own registry.
+"""
+import bisect
+import threading
+
+def _label_str(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{v}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally split by label values."""
+
+    def __init__(self, name, help_text, buckets, labels=()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._series = {}  # label values -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[idx] += 1
+            series[-1] += value
+
+    def snapshot(self):
+        """Return {label values: {"count", "sum", "buckets": [(le, cumulative)]}}."""
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._series.items()]
+        out = {}
+        for key, series in items:
+            cumulative, running = [], 0
+            for le, n in zip(self.buckets + (float("inf"),), series[:-1]):
+                running += n
+                cumulative.append((le, running))
+            out[key] = {"count": running, "sum": series[-1], "buckets": cumulative}
+        return out
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, s in sorted(self.snapshot().items()):
+            for le, n in s["buckets"]:
+                le_str = "+Inf" if le == float("inf") else repr(le)
+                lbl = _label_str(self.labels + ("le",), key + (le_str,))
+                lines.append(f"{self.name}_bucket{lbl} {n}")
+            lbl = _label_str(self.labels, key)
+            lines.append(f"{self.name}_sum{lbl} {s['sum']}")
+            lines.append(f"{self.name}_count{lbl} {s['count']}")
+        return "\n".join(lines)
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def histogram(self, name, help_text, buckets, labels=()):
+        h = Histogram(name, help_text, buckets, labels)
+        self._metrics.append(h)
+        return h
+
+    def render(self):
+        return "\n".join(m.render() for m in self._metrics) + "\n"
+
+REGISTRY = Registry()
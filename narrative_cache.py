@@ -0,0 +1,166 @@
+# narrative_cache.py
+"""
+SQLite cache of AI narratives keyed by prompt template hash and placements.
+
+Cached narratives are generated for NAME_TOKEN instead of a real first name and
+personalized on the way out, so one completion serves every reader with the
+same Sun, Moon, Rising and Nodes. Enabled when NARRATIVE_CACHE_PATH is set;
+scripts/prewarm_narrative_cache.py fills it ahead of traffic.
+"""
+import atexit
+import collections
+import os
+import sqlite3
+import threading
+import time
+
+NAME_TOKEN = "[NAME]"
+SIGNS = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+)
+PLACEMENT_FIELDS = ("sun_sign", "moon_sign", "rising_sign", "north_node_sign", "south_node_sign")
+
+def placements_from_chart(chart_data):
+    """(sun, moon, rising, north node, south node) from a chart_data dict."""
+    return (
+        chart_data.get('sun_sign', 'Unknown'),
+        chart_data.get('moon_sign', 'Unknown'),
+        chart_data.get('rising_sign', 'Unknown'),
+        chart_data.get('north_node', {}).get('sign', 'Unknown'),
+        chart_data.get('south_node', {}).get('sign', 'Unknown'),
+    )
+
+def opposite_sign(sign):
+    return SIGNS[(SIGNS.index(sign) + 6) % 12]
+
+def all_placements():
+    """Every sun/moon/rising/north node combination (south node is opposite north)."""
+    for sun in SIGNS:
+        for moon in SIGNS:
+            for rising in SIGNS:
+                for north in SIGNS:
+                    yield (sun, moon, rising, north, opposite_sign(north))
+
+def render_prompt(template, placements, first_name=NAME_TOKEN):
+    return template.render(first_name=first_name, **dict(zip(PLACEMENT_FIELDS, placements)))
+
+def personalize(text, first_name):
+    return text.replace(NAME_TOKEN, first_name)
+
+def cache_key(digest, placements):
+    return digest + ":" + "|".join(placements)
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS narratives (
+        key        TEXT PRIMARY KEY,
+        digest     TEXT,
+        placements TEXT,
+        text       TEXT,
+        created_at REAL
+    );
+    CREATE TABLE IF NOT EXISTS placement_stats (
+        placements TEXT PRIMARY KEY,
+        hits       INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS prewarm_progress (
+        key        TEXT PRIMARY KEY,
+        status     TEXT,
+        attempts   INTEGER,
+        error      TEXT,
+        updated_at REAL
+    );
+"""
+
+class NarrativeCache:
+    """
+    Thread-safe SQLite store. Besides narratives it counts lookups per
+    placement (for choosing what to pre-warm) and keeps prewarm job progress.
+    Lookup counts are buffered in memory and written at most every
+    lookup_flush_interval seconds, so the request path doesn't commit.
+    """
+
+    def __init__(self, path, lookup_flush_interval=5.0):
+        self.path = path
+        self._local = threading.local()
+        self.lookup_flush_interval = lookup_flush_interval
+        self._lookups = collections.Counter()
+        self._lookups_pid = os.getpid()
+        self._lookups_lock = threading.Lock()
+        self._next_flush = time.monotonic() + lookup_flush_interval
+        atexit.register(self.flush_lookups)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():  # never reuse a connection across fork
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            conn.executescript(_SCHEMA)  # first use in this process/thread, never at import
+        return conn
+
+    def get(self, digest, placements):
+        row = self._conn().execute(
+            "SELECT text FROM narratives WHERE key = ?", (cache_key(digest, placements),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, digest, placements, text):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO narratives VALUES (?,?,?,?,?)",
+            (cache_key(digest, placements), digest, "|".join(placements), text, time.time())
+        )
+        conn.commit()
+
+    def cached_keys(self, digest):
+        rows = self._conn().execute("SELECT key FROM narratives WHERE digest = ?", (digest,))
+        return {r[0] for r in rows}
+
+    def record_lookup(self, placements):
+        with self._lookups_lock:
+            if self._lookups_pid != os.getpid():  # counts buffered before a fork belong to the parent
+                self._lookups.clear()
+                self._lookups_pid = os.getpid()
+            self._lookups["|".join(placements)] += 1
+            now = time.monotonic()
+            if now < self._next_flush:
+                return
+            self._next_flush = now + self.lookup_flush_interval
+        self.flush_lookups()
+
+    def flush_lookups(self):
+        """Write buffered lookup counts in one transaction."""
+        with self._lookups_lock:
+            if not self._lookups or self._lookups_pid != os.getpid():
+                return
+            pending, self._lookups = self._lookups, collections.Counter()
+        conn = self._conn()
+        conn.executemany(
+            "INSERT INTO placement_stats VALUES (?, ?) "
+            "ON CONFLICT(placements) DO UPDATE SET hits = hits + excluded.hits",
+            pending.items()
+        )
+        conn.commit()
+
+    def top_placements(self, limit):
+        self.flush_lookups()
+        rows = self._conn().execute(
+            "SELECT placements FROM placement_stats ORDER BY hits DESC LIMIT ?", (limit,)
+        )
+        return [tuple(r[0].split("|")) for r in rows]
+
+    def set_progress(self, key, status, error=None):
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO prewarm_progress VALUES (?,?,1,?,?) "
+            "ON CONFLICT(key) DO UPDATE SET status = excluded.status, attempts = attempts + 1, "
+            "error = excluded.error, updated_at = excluded.updated_at",
+            (key, status, error, time.time())
+        )
+        conn.commit()
+
+    def failed_keys(self):
+        rows = self._conn().execute("SELECT key FROM prewarm_progress WHERE status = 'failed'")
+        return {r[0] for r in rows}
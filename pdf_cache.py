@@ -0,0 +1,114 @@
+# pdf_cache.py
+"""
+Content-addressed cache of rendered PDFs.
+
+The key is a hash of the report spec (pdf_report.report_spec: first name,
+chart rows, sections, theme) plus the template version, so retries and
+re-sends of the same report skip ReportLab entirely, and any change to the
+layout code, styles, PDF_STATIC_PAGES or the ReportLab / pypdf versions
+starts a fresh keyspace. PDFs live in
+a SQLite file shared by every worker; once the stored bytes pass max_bytes the
+least recently used entries are dropped. Enabled when PDF_CACHE_PATH is set.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from importlib import metadata
+
+_TEMPLATE_SOURCES = ("pdf_report.py", "pdf_styles.py")
+_template_version = None
+
+def template_version():
+    """
+    Digest of the PDF layout and style sources, the static-page setting and
+    the ReportLab and pypdf (which merges static pages) versions.
+    """
+    global _template_version
+    if _template_version is None:
+        h = hashlib.sha256()
+        base = os.path.dirname(os.path.abspath(__file__))
+        for name in _TEMPLATE_SOURCES:
+            with open(os.path.join(base, name), "rb") as f:
+                h.update(f.read())
+        from pdf_report import STATIC_PAGES
+        h.update(f"static_pages={int(STATIC_PAGES)}".encode())
+        for package in ("reportlab", "pypdf"):
+            try:
+                h.update(f"{package}={metadata.version(package)}".encode())
+            except metadata.PackageNotFoundError:
+                pass
+        _template_version = h.hexdigest()[:16]
+    return _template_version
+
+def spec_key(spec, version=None):
+    payload = json.dumps(spec, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{version or template_version()}\n{payload}".encode()).hexdigest()
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pdfs (
+        key       TEXT PRIMARY KEY,
+        body      BLOB,
+        size      INTEGER,
+        last_used REAL
+    );
+    CREATE INDEX IF NOT EXISTS pdfs_last_used ON pdfs (last_used);
+"""
+
+class PdfCache:
+    """Thread- and process-safe SQLite store of PDF bytes with size-bounded LRU eviction."""
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():  # never reuse a connection across fork
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+            conn.executescript(_SCHEMA)  # first use in this process/thread, never at import
+        return conn
+
+    def get(self, key):
+        conn = self._conn()
+        row = conn.execute("SELECT body FROM pdfs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE pdfs SET last_used = ? WHERE key = ?", (time.time(), key))
+        conn.commit()
+        return bytes(row[0])
+
+    def put(self, key, pdf_bytes):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO pdfs VALUES (?,?,?,?)",
+            (key, sqlite3.Binary(pdf_bytes), len(pdf_bytes), time.time())
+        )
+        conn.commit()
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used PDFs until the total size fits max_bytes."""
+        conn = self._conn()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pdfs").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        dropped = 0
+        for key, size in conn.execute("SELECT key, size FROM pdfs ORDER BY last_used").fetchall():
+            conn.execute("DELETE FROM pdfs WHERE key = ?", (key,))
+            total -= size
+            dropped += 1
+            if total <= self.max_bytes:
+                break
+        conn.commit()
+        return dropped
+
+    def stats(self):
+        count, total = self._conn().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pdfs").fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
@@ -0,0 +1,157 @@
+# pdf_pool.py
+"""
+Process pool for PDF rendering.
+
+ReportLab layout is pure-Python CPU work that holds the GIL, so rendering in
+the web worker stalls every other request thread in it. PdfRenderPool keeps a
+few long-lived render processes, each fed report specs (pdf_report.report_spec)
+over its own pipe:
+
+- bounded queue: at most max_queue callers wait for a free process; more
+  raise PoolBusy instead of piling up
+- per-job timeout: a job that overruns gets its process killed and replaced,
+  and the caller gets TimeoutError
+- crash isolation: a render process that dies only fails its own job
+  (RenderCrashed) and is replaced
+
+Replacements are started on a background thread, so a request that saw a
+timeout or crash doesn't also wait for a new interpreter to spawn.
+
+Enabled in app.py with PDF_RENDER_WORKERS=<n>.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+
+class PoolBusy(RuntimeError):
+    """The render queue is full."""
+
+class RenderCrashed(RuntimeError):
+    """The render process died mid-job."""
+
+class RenderError(RuntimeError):
+    """The renderer raised; carries the child's error message."""
+
+def _serve(conn):
+    """Render process loop: receive a spec, send back ("ok", bytes) or ("error", message)."""
+    from pdf_report import render_spec
+    from pdf_styles import get_styles
+    get_styles()  # import ReportLab and build styles before the first job
+    while True:
+        try:
+            spec = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send(("ok", render_spec(spec)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+class _Worker:
+    __slots__ = ("process", "conn", "jobs")
+
+    def __init__(self, ctx):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_serve, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.jobs = 0
+
+    def kill(self):
+        self.conn.close()
+        self.process.kill()
+        self.process.join(5)
+
+class PdfRenderPool:
+    def __init__(self, workers=2, max_queue=8, timeout=30, max_jobs=500, start_method="spawn"):
+        self.size = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_jobs = max_jobs  # recycle a process after this many jobs (0 = never)
+        self.pid = os.getpid()
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._closed = False
+        self.stats = {"jobs": 0, "busy": 0, "timeouts": 0, "crashes": 0, "errors": 0, "restarts": 0}
+        for _ in range(workers):
+            self._idle.put(_Worker(self._ctx))
+
+    def render(self, spec):
+        """PDF bytes for spec, rendered in a pool process."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PdfRenderPool is closed")
+            if self._waiting >= self.size + self.max_queue:
+                self.stats["busy"] += 1
+                raise PoolBusy(f"{self._waiting} PDF renders already queued or running")
+            self._waiting += 1
+        try:
+            try:
+                worker = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                self._count("timeouts")
+                raise TimeoutError(f"no PDF render process free within {self.timeout}s")
+            return self._run(worker, spec)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def _run(self, worker, spec):
+        healthy = False
+        try:
+            worker.conn.send(spec)
+            if not worker.conn.poll(self.timeout):
+                self._count("timeouts")
+                raise TimeoutError(f"PDF render exceeded {self.timeout}s")
+            status, payload = worker.conn.recv()
+            healthy = True
+        except TimeoutError:
+            raise
+        except (EOFError, OSError) as e:
+            self._count("crashes")
+            raise RenderCrashed(f"PDF render process exited (code {worker.process.exitcode})") from e
+        finally:
+            worker.jobs += 1
+            self._release(worker, healthy)
+        self._count("jobs")
+        if status != "ok":
+            self._count("errors")
+            raise RenderError(payload)
+        return payload
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _release(self, worker, healthy):
+        """Return a worker to the idle queue, replacing it if it is hung, dead or worn out."""
+        if healthy and worker.process.is_alive() and not (self.max_jobs and worker.jobs >= self.max_jobs):
+            self._idle.put(worker)
+            return
+        threading.Thread(target=self._replace, args=(worker,), name="pdf-pool-respawn", daemon=True).start()
+
+    def _replace(self, worker):
+        """Kill worker and add a fresh process in its place (runs off the request thread)."""
+        worker.kill()
+        with self._lock:
+            if self._closed:
+                return
+        fresh = _Worker(self._ctx)
+        with self._lock:
+            if not self._closed:
+                self.stats["restarts"] += 1
+                self._idle.put(fresh)
+                return
+        fresh.kill()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
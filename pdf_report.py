@@ -0,0 +1,140 @@
+# pdf_report.py
+"""
+PDF report layout, split into a plain-data story spec and a renderer.
+
+report_spec() turns a parsed ReportDocument (report_document.py) into a
+small dict of strings (picklable, cheap to build, no ReportLab import);
+render_spec() lays it out with ReportLab and returns the PDF bytes. The
+split lets pdf_pool.py render specs in separate processes.
+
+With PDF_STATIC_PAGES=1 the closing disclaimer page, identical in every
+report, is rendered once per theme and appended to each report's own pages
+with pypdf (in requirements.txt) instead of being laid out again. If pypdf
+is missing the setting is refused with a warning at import, not dropped
+silently per render.
+"""
+import importlib.util
+import io
+import os
+import threading
+from xml.sax.saxutils import escape
+
+STATIC_PAGES = os.getenv("PDF_STATIC_PAGES") == "1"
+if STATIC_PAGES and importlib.util.find_spec("pypdf") is None:
+    print("[pdf_report] WARNING: PDF_STATIC_PAGES=1 needs pypdf (pip install pypdf); "
+          "it is not installed, so every page is laid out per report")
+    STATIC_PAGES = False
+
+DOWNLOAD_NOTE = "You can download and print this report using the attachment or your browser’s print option."
+DISCLAIMER = (
+    "Guiding you on your cosmic journey of self-discovery. "
+    "For entertainment and self-reflection purposes only. Not predictive or definitive."
+)
+
+def chart_rows(chart_data):
+    """[[label, value]] rows for the chart essentials table."""
+    return [
+        ["Sun", chart_data.get("sun_sign", "")],
+        ["Moon", chart_data.get("moon_sign", "")],
+        ["Rising", chart_data.get("rising_sign", "")],
+        ["North Node", chart_data.get("north_node", {}).get("sign", "")],
+        ["South Node", chart_data.get("south_node", {}).get("sign", "")]
+    ]
+
+def report_spec(document, theme=None):
+    """
+    Everything render_spec() needs from a ReportDocument, as plain data. The
+    name and section text become Paragraph markup, so they are XML-escaped
+    here (table cells are plain strings and stay as they are).
+    """
+    return {
+        "first_name": escape(document.first_name),
+        "chart_rows": chart_rows(document.chart) if document.chart else None,
+        "sections": [[escape(s.header), [escape(p) for p in s.paragraphs]] for s in document.sections],
+        "theme": theme,
+    }
+
+def _build(story):
+    """Lay out a list of flowables on the report page template; returns PDF bytes."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate
+    from reportlab.lib.units import inch
+
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buf,
+        pagesize=A4,
+        rightMargin=0.8*inch, leftMargin=0.8*inch,
+        topMargin=1*inch, bottomMargin=1*inch
+    )
+    doc.build(story)
+    return buf.getvalue()
+
+def _closing_page(styles):
+    """Download note and disclaimer; starts on a page of its own."""
+    from reportlab.platypus import Paragraph
+    return [
+        Paragraph(DOWNLOAD_NOTE, styles.disclaimer),
+        Paragraph(DISCLAIMER, styles.disclaimer),
+    ]
+
+def render_spec(spec, static_pages=None):
+    """Lay out a report spec with ReportLab and return the PDF bytes."""
+    from reportlab.platypus import Paragraph, Spacer, Table, PageBreak
+    from pdf_styles import get_styles
+
+    # Styles are built once per theme and shared across requests
+    styles = get_styles(spec.get("theme"))
+
+    story = []
+    # Cover
+    story.append(Paragraph("Nodal Pathways", styles.title))
+    story.append(Paragraph(f"Personalized Astrological Report for {spec['first_name']}", styles.subtitle))
+
+    # Chart Essentials table
+    if spec.get("chart_rows"):
+        t = Table(spec["chart_rows"], colWidths=[styles.chart_label_width, None])
+        t.setStyle(styles.chart_table)
+        story.append(t)
+        story.append(Spacer(1, styles.chart_spacer))
+
+    # Narrative sections
+    for header, paragraphs in spec["sections"]:
+        story.append(Paragraph(header, styles.section))
+        for p in paragraphs:
+            story.append(Paragraph(p, styles.body))
+
+    # Disclaimer + instructions
+    if static_pages is None:
+        static_pages = STATIC_PAGES
+    if static_pages:
+        return merge_pdfs(_build(story), closing_pages(spec.get("theme")))
+    story.append(PageBreak())
+    story.extend(_closing_page(styles))
+    return _build(story)
+
+# ===== Pre-rendered static pages =====
+_static = {}
+_static_lock = threading.Lock()
+
+def closing_pages(theme=None):
+    """The closing page(s) for a theme, rendered once and kept as PDF bytes."""
+    from pdf_styles import get_styles
+    styles = get_styles(theme)
+    pages = _static.get(styles.theme.name)
+    if pages is None:
+        with _static_lock:
+            pages = _static.get(styles.theme.name)
+            if pages is None:
+                pages = _static[styles.theme.name] = _build(_closing_page(styles))
+    return pages
+
+def merge_pdfs(*documents):
+    """Concatenate the pages of already rendered PDFs, without re-laying them out."""
+    import pypdf
+    writer = pypdf.PdfWriter()
+    for data in documents:
+        writer.append(pypdf.PdfReader(io.BytesIO(data)))
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
@@ -0,0 +1,117 @@
+# pdf_styles.py
+"""
+ReportLab styles for the PDF report, built once per theme.
+
+ParagraphStyle and TableStyle objects are only read while a document is laid
+out, so one PdfStyles instance is shared by every request and thread.
+get_styles() builds a theme on first use; PDF_THEME picks the default theme.
+"""
+import os
+import threading
+from collections import namedtuple
+
+from reportlab.lib.colors import HexColor, black
+from reportlab.lib.styles import ParagraphStyle, TA_CENTER, TA_JUSTIFY
+from reportlab.lib.units import inch
+from reportlab.platypus import TableStyle
+
+Theme = namedtuple("Theme", "name accent heading muted text font font_bold font_italic")
+
+THEMES = {
+    "default": Theme(
+        name="default",
+        accent="#edd598",   # gold
+        heading="#2d3748",  # dark navy
+        muted="#555555",
+        text=None,          # ReportLab black
+        font="Helvetica",
+        font_bold="Helvetica-Bold",
+        font_italic="Helvetica-Oblique",
+    ),
+}
+
+class PdfStyles:
+    __slots__ = ("theme", "accent", "heading", "muted", "text",
+                 "title", "subtitle", "section", "body", "disclaimer",
+                 "chart_table", "chart_label_width", "chart_spacer")
+
+    def __init__(self, theme):
+        self.theme = theme
+        self.accent = accent = HexColor(theme.accent)
+        self.heading = heading = HexColor(theme.heading)
+        self.muted = muted = HexColor(theme.muted)
+        self.text = text = HexColor(theme.text) if theme.text else black
+
+        self.title = ParagraphStyle(
+            'Title',
+            fontSize=30,
+            textColor=accent,
+            spaceAfter=24,
+            alignment=TA_CENTER,
+            fontName=theme.font_bold,
+            leading=34
+        )
+        self.subtitle = ParagraphStyle(
+            'Subtitle',
+            fontSize=14,
+            textColor=muted,
+            spaceAfter=36,
+            alignment=TA_CENTER,
+            fontName=theme.font,
+            leading=20
+        )
+        self.section = ParagraphStyle(
+            'SectionHeader',
+            fontSize=18,
+            textColor=heading,
+            spaceBefore=18,
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName=theme.font_bold,
+            leading=22
+        )
+        self.body = ParagraphStyle(
+            'Body',
+            fontSize=13,
+            textColor=text,
+            spaceAfter=12,
+            alignment=TA_JUSTIFY,
+            fontName=theme.font,
+            leading=18
+        )
+        self.disclaimer = ParagraphStyle(
+            'Disclaimer',
+            fontSize=11,
+            textColor=heading,
+            spaceBefore=30,
+            alignment=TA_CENTER,
+            fontName=theme.font_italic,
+            leading=15
+        )
+        self.chart_table = TableStyle([
+            ("FONTNAME", (0,0), (-1,-1), theme.font),
+            ("FONTSIZE", (0,0), (-1,-1), 12),
+            ("TEXTCOLOR", (0,0), (0,-1), accent),   # labels in gold
+            ("TEXTCOLOR", (1,0), (1,-1), heading),  # values in dark navy
+            ("LINEBELOW", (0,0), (-1,-1), 0.25, muted),
+            ("LEFTPADDING", (0,0), (-1,-1), 6),
+            ("RIGHTPADDING", (0,0), (-1,-1), 6),
+            ("TOPPADDING", (0,0), (-1,-1), 4),
+            ("BOTTOMPADDING", (0,0), (-1,-1), 4),
+        ])
+        self.chart_label_width = 1.8*inch
+        self.chart_spacer = 0.3*inch
+
+_styles = {}
+_lock = threading.Lock()
+
+def get_styles(theme_name=None):
+    """Shared PdfStyles for a theme (default: PDF_THEME or "default")."""
+    theme_name = theme_name or os.getenv("PDF_THEME", "default")
+    styles = _styles.get(theme_name)
+    if styles is None:
+        with _lock:
+            styles = _styles.get(theme_name)
+            if styles is None:
+                styles = _styles[theme_name] = PdfStyles(THEMES[theme_name])
+    return styles
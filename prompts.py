@@ -0,0 +1,121 @@
+# prompts.py
+"""
+Prompt template registry.
+
+Templates are parsed once at import into static chunks and named slots, so a
+render is a single join. Each template has a stable content hash (name,
+variant, version and source) that callers fold into cache keys: the key only
+changes when the prompt text actually changes, not on every deploy.
+
+PROMPT_VARIANT selects "full" (the original wording) or "compact" (same
+sections, instructions stated once, fewer input tokens).
+"""
+import hashlib
+import os
+from string import Formatter
+
+class PromptTemplate:
+    __slots__ = ("name", "variant", "version", "source", "fields", "digest", "_parts", "_static_len")
+
+    def __init__(self, name, variant, version, source):
+        self.name = name
+        self.variant = variant
+        self.version = version
+        self.source = source
+        parts, fields = [], []
+        for literal, field, spec, conv in Formatter().parse(source):
+            if spec or conv:
+                raise ValueError(f"{name}/{variant}: format specs are not supported in prompt templates")
+            if literal:
+                parts.append((True, literal))
+            if field is not None:
+                parts.append((False, field))
+                if field not in fields:
+                    fields.append(field)
+        self._parts = tuple(parts)
+        self._static_len = sum(len(v) for is_static, v in parts if is_static)
+        self.fields = tuple(fields)
+        blob = f"{name}\0{variant}\0{version}\0{source}".encode("utf-8")
+        self.digest = hashlib.sha256(blob).hexdigest()[:16]
+
+    @property
+    def key(self):
+        return f"{self.name}/{self.variant}@{self.version}"
+
+    def render(self, **values):
+        missing = [f for f in self.fields if f not in values]
+        if missing:
+            raise KeyError(f"{self.key} missing values for: {', '.join(missing)}")
+        return "".join(v if is_static else str(values[v]) for is_static, v in self._parts)
+
+    def __repr__(self):
+        return f"<PromptTemplate {self.key} {self.digest} static_chars={self._static_len}>"
+
+# ===== Registry =====
+_TEMPLATES = {}
+
+def register(name, variant, version, source):
+    tpl = PromptTemplate(name, variant, version, source)
+    current = _TEMPLATES.get((name, variant))
+    if current is None or version > current.version:
+        _TEMPLATES[(name, variant)] = tpl
+    return tpl
+
+def get_template(name, variant=None):
+    """Latest version of a template; variant defaults to PROMPT_VARIANT or "full"."""
+    variant = variant or os.getenv("PROMPT_VARIANT", "full")
+    try:
+        return _TEMPLATES[(name, variant)]
+    except KeyError:
+        raise KeyError(f"No prompt template {name}/{variant}") from None
+
+def all_templates():
+    return sorted(_TEMPLATES.values(), key=lambda t: t.key)
+
+# ===== Report prompts =====
+register("report", "full", 1, """
+You are an expert astrologer. Write a personalized report for {first_name}.
+Do not use em dashes. Use plain periods or commas.
+
+Placements:
+Sun {sun_sign}; Moon {moon_sign}; Rising {rising_sign}; North Node {north_node_sign}; South Node {south_node_sign}.
+
+Create exactly these sections with clear headers:
+
+SECTION: Your Cosmic Blueprint
+[2–3 short paragraphs introducing {first_name} to their combination. No em dashes.]
+
+SECTION: Your Inner Light - Sun in {sun_sign}
+[2 short paragraphs on {sun_sign} core identity. No em dashes.]
+
+SECTION: Your Emotional Nature - Moon in {moon_sign}
+[2 short paragraphs on emotions and needs. No em dashes.]
+
+SECTION: Your Rising Persona - {rising_sign} Ascending
+[2 short paragraphs on first impression and approach. No em dashes.]
+
+SECTION: Your Soul's Journey - The Nodal Pathway
+[3 short paragraphs: growth from {south_node_sign} to {north_node_sign}. No em dashes.]
+
+SECTION: Integration and Growth
+[2–3 short paragraphs of practical guidance. No em dashes.]
+
+Use {first_name}'s name naturally. Counseling tone. No em dashes.
+""")
+
+register("report", "compact", 1, """Expert astrologer. Personalized report for {first_name}: counseling tone, use the name naturally, never use em dashes.
+Sun {sun_sign}; Moon {moon_sign}; Rising {rising_sign}; North Node {north_node_sign}; South Node {south_node_sign}.
+Write exactly these sections, each starting with its header line:
+SECTION: Your Cosmic Blueprint
+(2-3 short paragraphs introducing the combination)
+SECTION: Your Inner Light - Sun in {sun_sign}
+(2 short paragraphs, core identity)
+SECTION: Your Emotional Nature - Moon in {moon_sign}
+(2 short paragraphs, emotions and needs)
+SECTION: Your Rising Persona - {rising_sign} Ascending
+(2 short paragraphs, first impression and approach)
+SECTION: Your Soul's Journey - The Nodal Pathway
+(3 short paragraphs, growth from {south_node_sign} to {north_node_sign})
+SECTION: Integration and Growth
+(2-3 short paragraphs, practical guidance)
+""")
@@ -0,0 +1,35 @@
+# report_document.py
+"""
+Parsed report document shared by every renderer.
+
+The AI narrative is split once, by parse_report(), into sections of
+paragraphs; the HTML template (html_templates.py) and the PDF layout
+(pdf_report.py) only lay out a ReportDocument and never look at the raw text.
+Text is kept unescaped; each output format escapes for itself.
+"""
+from collections import namedtuple
+
+Section = namedtuple("Section", "header paragraphs")
+ReportDocument = namedtuple("ReportDocument", "first_name chart sections")
+
+def split_paragraphs(text):
+    """Sentence-per-paragraph split on '. ', each ending in a period."""
+    paragraphs = []
+    for p in text.split(". "):
+        p = p.strip()
+        if p:
+            paragraphs.append(p if p.endswith(".") else p + ".")
+    return tuple(paragraphs)
+
+def parse_sections(ai_text):
+    """Sections from 'SECTION: <header>' delimited AI text; the header is the first line."""
+    sections = []
+    for sec in ai_text.split("SECTION:"):
+        lines = [ln.strip() for ln in sec.split("\n")]
+        lines = [ln for ln in lines if ln]
+        if lines:
+            sections.append(Section(lines[0], split_paragraphs(" ".join(lines[1:]))))
+    return tuple(sections)
+
+def parse_report(ai_text, first_name="Friend", chart_data=None):
+    return ReportDocument(first_name, chart_data, parse_sections(ai_text))
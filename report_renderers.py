@@ -0,0 +1,95 @@
+# report_renderers.py
+"""
+Every output format of a report, rendered from one ReportDocument.
+
+A renderer is a function document -> bytes or str, registered under a format
+name with its content type. All of them lay out the same parsed sections, so
+the AI text is segmented once per report whatever the number of formats.
+render_all() produces several formats in one call: background renderers
+(PDF) are started on a small thread pool first and the rest render in the
+calling thread meanwhile. With the PDF render pool or cache enabled the PDF
+wait is mostly off the GIL, so the request takes about as long as the PDF
+alone instead of the sum of all formats.
+
+app.py registers its own "pdf" renderer (PDF cache, render pool) over the
+plain one below.
+"""
+import json
+import os
+import textwrap
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from html_templates import render_report
+from pdf_report import DISCLAIMER, DOWNLOAD_NOTE, chart_rows, render_spec, report_spec
+
+Renderer = namedtuple("Renderer", "name content_type render background")
+
+_RENDERERS = {}
+
+def register(name, content_type, render, background=False):
+    """Add or replace the renderer for a format; background ones run on the render threads."""
+    _RENDERERS[name] = Renderer(name, content_type, render, background)
+    return _RENDERERS[name]
+
+def get_renderer(name):
+    return _RENDERERS[name]
+
+def formats():
+    return tuple(_RENDERERS)
+
+# ===== Built-in formats =====
+def render_text(document):
+    """Plain-text report, e.g. for the text/plain part of an email."""
+    out = ["NODAL PATHWAYS", f"Personalized Astrological Report for {document.first_name}", ""]
+    if document.chart:
+        out.extend(f"{label}: {value}" for label, value in chart_rows(document.chart))
+        out.append("")
+    for section in document.sections:
+        out.extend((section.header.upper(), ""))
+        out.extend(textwrap.wrap(" ".join(section.paragraphs), 78))
+        out.append("")
+    out.extend((DOWNLOAD_NOTE, "", DISCLAIMER))
+    return "\n".join(out) + "\n"
+
+def render_json(document):
+    return json.dumps({
+        "first_name": document.first_name,
+        "chart": document.chart,
+        "sections": [{"header": s.header, "paragraphs": list(s.paragraphs)} for s in document.sections],
+    }, ensure_ascii=False)
+
+register("html", "text/html; charset=utf-8", render_report)
+register("html_min", "text/html; charset=utf-8", lambda document: render_report(document, minify=True))
+register("pdf", "application/pdf", lambda document: render_spec(report_spec(document)), background=True)
+register("text", "text/plain; charset=utf-8", render_text)
+register("json", "application/json", render_json)
+
+# ===== Fan-out =====
+RENDER_THREADS = int(os.getenv("RENDER_THREADS", "4"))
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+def _get_executor():
+    """This process's render threads (recreated after fork)."""
+    global _executor, _executor_pid
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(RENDER_THREADS, thread_name_prefix="render")
+            _executor_pid = os.getpid()
+        return _executor
+
+def render_all(document, names=None):
+    """{format: output} for the given formats (default: all registered)."""
+    renderers = [_RENDERERS[name] for name in (names or _RENDERERS)]
+    background = [r for r in renderers if r.background]
+    futures = {}
+    if len(renderers) > 1:
+        executor = _get_executor()
+        futures = {r.name: executor.submit(r.render, document) for r in background}
+    out = {r.name: r.render(document) for r in renderers if r.name not in futures}
+    for name, future in futures.items():
+        out[name] = future.result()
+    return {r.name: out[r.name] for r in renderers}
@@ -0,0 +1,147 @@
+# scripts/bench_html_report.py
+"""
+Benchmark create_html_report (precompiled report.html) against the previous
+f-string + string concatenation implementation kept below as the baseline.
+
+  python scripts/bench_html_report.py
+  python scripts/bench_html_report.py --sections 12 --sentences 20 --runs 5000
+
+The precompiled path also parses the text into a ReportDocument and escapes
+it, which the baseline never did; "render only" times the template alone.
+
+Also checks both produce identical HTML for input without characters that
+need escaping (the baseline didn't escape), and that no blueprint slot
+renders a Python repr (e.g. a tuple field) instead of text.
+"""
+import argparse, os, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("LLM_BACKEND", "mock")
+from app import create_html_report
+from html_templates import BLUEPRINT_HTML, blueprint_values, render_report
+from knowledge_entries import get_entries
+from report_document import parse_report
+
+CHART = {
+    "sun_sign": "Pisces", "moon_sign": "Leo", "rising_sign": "Virgo",
+    "north_node": {"sign": "Sagittarius"}, "south_node": {"sign": "Gemini"},
+}
+
+def legacy_create_html_report(chart_data, ai_text, first_name="Friend"):
+    """create_html_report before html_templates.py."""
+
+    # Essentials block
+    chart_basics = f"""
+    <div class="chart-basics">
+        <h3>Chart Essentials for {first_name}</h3>
+        <div class="basics-grid">
+            <div class="basic-item"><strong>Sun Sign:</strong> {chart_data['sun_sign']}</div>
+            <div class="basic-item"><strong>Moon Sign:</strong> {chart_data['moon_sign']}</div>
+            <div class="basic-item"><strong>Rising Sign:</strong> {chart_data['rising_sign']}</div>
+            <div class="basic-item"><strong>North Node:</strong> {chart_data['north_node']['sign']}</div>
+            <div class="basic-item"><strong>South Node:</strong> {chart_data['south_node']['sign']}</div>
+        </div>
+    </div>
+    """
+
+    # Parse AI text into sections
+    sections_html = []
+    sections = [s.strip() for s in ai_text.split("SECTION:") if s.strip()]
+    for sec in sections:
+        lines = [ln.strip() for ln in sec.split("\n") if ln.strip()]
+        if not lines:
+            continue
+        header = lines[0].replace("SECTION:", "").strip()
+        body_text = " ".join(lines[1:])
+        paragraphs = [p.strip() for p in body_text.split(". ") if p.strip()]
+
+        sec_html = f"<div class='section'><h2>{header}</h2>"
+        for p in paragraphs:
+            if not p.endswith("."):
+                p += "."
+            sec_html += f"<p>{p}</p>"
+        sec_html += "</div>"
+        sections_html.append(sec_html)
+
+    sections_content = "\n".join(sections_html)
+
+    # Full HTML
+    html = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>Nodal Pathways Report - {first_name}</title>
+<style>
+body {{ font-family: -apple-system, BlinkMacSystemFont, Inter, Helvetica, Arial, sans-serif; background:#ffffff; color:#111; margin:0; }}
+.container {{ max-width: 900px; margin: 0 auto; padding: 24px; }}
+.header {{ text-align:center; padding: 36px 12px; background:#2d3748; border-radius:16px; }}
+.header h1 {{ color:#edd598; margin:0 0 8px 0; }}
+.header .subtitle {{ color:#e2e8f0; }}
+.basics-grid {{ display:grid; grid-template-columns:1fr 1fr; gap:12px; }}
+.basic-item {{ background:#2a3141; border:1px solid #3a4151; padding:14px; border-radius:10px; color:#e2e8f0; }}
+strong {{ color:#edd598; }}
+.section h2 {{ color:#2d3748; text-align:center; margin:28px 0 12px; font-size:20px; }}
+.section p {{ line-height:1.6; text-align:left; margin-bottom:14px; }}
+.footer {{ text-align:center; margin-top:32px; padding:24px; background:#2d3748; border-radius:14px; color:#e2e8f0; }}
+.disclaimer {{ margin:22px auto; max-width:760px; text-align:center; color:#2d3748; font-size:13px; }}
+.instructions {{ text-align:center; font-size:13px; color:#2d3748; margin-top:30px; }}
+</style>
+</head>
+<body>
+<div class="container">
+  <div class="header">
+    <h1>Nodal Pathways</h1>
+    <div class="subtitle">Personalized Astrological Report for {first_name}</div>
+  </div>
+  {chart_basics}
+  {sections_content}
+  <p class="instructions">
+    You can download and print this report using the attachment or your browser’s print option.
+  </p>
+  <div class="disclaimer">
+    Guiding you on your cosmic journey of self-discovery.<br>
+    For entertainment and self-reflection purposes only. Not predictive or definitive.
+  </div>
+  <div class="footer">
+    Nodal Pathways
+  </div>
+</div>
+</body>
+</html>"""
+    return html
+
+def sample_text(sections, sentences):
+    return "\n".join(
+        f"SECTION: Part {i + 1}\n" + " ".join(f"Sentence {j} about your chart and growth." for j in range(sentences))
+        for i in range(sections)
+    )
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sections", type=int, default=6)
+    ap.add_argument("--sentences", type=int, default=12)
+    ap.add_argument("--runs", type=int, default=2000)
+    args = ap.parse_args()
+
+    text = sample_text(args.sections, args.sentences)
+    same = legacy_create_html_report(CHART, text, "Friend") == create_html_report(CHART, text, "Friend")
+    print(f"identical output: {same}\n")
+
+    entries = get_entries()
+    document = parse_report(text, "Friend", CHART)
+    values = blueprint_values(CHART, entries, 9)
+    blueprint = BLUEPRINT_HTML.render(**values)
+    print(f"blueprint free of escaped reprs: {'(&#39;' not in blueprint and '[&#39;' not in blueprint}\n")
+    cases = [
+        ("f-string (before)", lambda: legacy_create_html_report(CHART, text, "Friend")),
+        ("report.html (parse + render)", lambda: create_html_report(CHART, text, "Friend")),
+        ("report.html render only", lambda: render_report(document)),
+        ("template.html render only", lambda: BLUEPRINT_HTML.render(**values)),
+    ]
+    print("| path | us per render |\n|---|---:|")
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=args.runs, repeat=5)) / args.runs
+        print(f"| {name} | {best * 1e6:.1f} |")
+
+if __name__ == "__main__":
+    main()
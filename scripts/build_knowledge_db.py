@@ -0,0 +1,62 @@
+# scripts/build_knowledge_db.py
+"""Compile knowledge_base.py into the indexed SQLite file read by knowledge_store.py."""
+import json, os, sqlite3, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from knowledge_fragments import FragmentTable, fragment_stats
+from knowledge_store import DB_FORMAT, KB_SOURCE_PATH, KNOWLEDGE_DB_PATH, content_version, encode_key
+
+DB_PATH = os.getenv("KNOWLEDGE_DB_PATH", KNOWLEDGE_DB_PATH)
+
+def main():
+    from knowledge_base import KNOWLEDGE_BASE
+
+    tmp_path = DB_PATH + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    cur = conn.cursor()
+    cur.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+    cur.execute("CREATE TABLE fragments (id INTEGER PRIMARY KEY, text TEXT)")
+    cur.execute("""
+        CREATE TABLE entries (
+            section  TEXT,
+            key      TEXT,
+            position INTEGER,
+            body     TEXT,
+            PRIMARY KEY (section, key)
+        ) WITHOUT ROWID
+    """)
+
+    # One fragment table shared by every section
+    table = FragmentTable()
+    rows = 0
+    for section, entries in KNOWLEDGE_BASE.items():
+        for position, (key, entry) in enumerate(entries.items()):
+            encoded = table.encode_entry(entry)
+            if table.decode_entry(encoded) != entry:
+                raise SystemExit(f"Fragment round trip changed {section}/{key}")
+            cur.execute(
+                "INSERT INTO entries VALUES (?,?,?,?)",
+                (section, encode_key(key), position, json.dumps(encoded, separators=(",", ":")))
+            )
+            rows += 1
+    cur.executemany("INSERT INTO fragments VALUES (?,?)", enumerate(table.fragments))
+
+    original = sum(fragment_stats(entries, table)[0] for entries in KNOWLEDGE_BASE.values())
+    stored = sum(len(f) for f in table.fragments)
+
+    cur.executemany("INSERT INTO meta VALUES (?,?)", [
+        ("format", DB_FORMAT),
+        ("content_version", content_version(KB_SOURCE_PATH)),
+    ])
+    conn.commit()
+    cur.execute("VACUUM")
+    conn.close()
+    os.replace(tmp_path, DB_PATH)  # atomic for readers that already have the old file open
+    print(f"Built {DB_PATH} with {rows} entries ({os.path.getsize(DB_PATH)} bytes); "
+          f"{len(table)} fragments hold {stored} of {original} text chars")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# scripts/html_size_report.py
+"""
+Size of the emailed report HTML, as written (report.html) and minified, for
+a synthetic report, broken down by html_templates.size_report against the
+Gmail clipping budget.
+
+  python scripts/html_size_report.py
+  python scripts/html_size_report.py --sections 12 --sentences 40 --emails 5000
+
+--emails scales the per-report saving to a bulk send. Also checks that the
+minified HTML has the same visible text as the original.
+"""
+import argparse, os, re, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from html_templates import render_report, size_report
+from report_document import parse_report
+
+CHART = {
+    "sun_sign": "Pisces", "moon_sign": "Leo", "rising_sign": "Virgo",
+    "north_node": {"sign": "Sagittarius"}, "south_node": {"sign": "Gemini"},
+}
+
+def sample_text(sections, sentences):
+    return "\n".join(
+        f"SECTION: Part {i + 1}\n" + " ".join(f"Sentence {j} about your chart and growth." for j in range(sentences))
+        for i in range(sections)
+    )
+
+def visible_text(html):
+    html = re.sub(r"<style.*?</style>|<title.*?</title>", "", html, flags=re.S)
+    return " ".join(re.sub(r"<[^>]+>", " ", html).split())
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sections", type=int, default=6)
+    ap.add_argument("--sentences", type=int, default=12)
+    ap.add_argument("--emails", type=int, default=1000)
+    args = ap.parse_args()
+
+    document = parse_report(sample_text(args.sections, args.sentences), "Friend", CHART)
+    full, minified = render_report(document), render_report(document, minify=True)
+    print(f"same visible text: {visible_text(full) == visible_text(minified)}\n")
+
+    print("| html | total B | style B | markup B | text B | % of budget |\n|---|---:|---:|---:|---:|---:|")
+    reports = {}
+    for name, html in (("report.html", full), ("minified", minified)):
+        r = reports[name] = size_report(html)
+        print(f"| {name} | {r.total} | {r.style} | {r.markup} | {r.text} | {100 * r.total / r.budget:.1f} |")
+    saved = reports["report.html"].total - reports["minified"].total
+    print(f"\nsaved {saved} B per email ({100 * saved / reports['report.html'].total:.1f}%), "
+          f"{saved * args.emails / 2**20:.2f} MB over {args.emails} emails")
+
+if __name__ == "__main__":
+    main()
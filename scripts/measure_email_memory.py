@@ -0,0 +1,104 @@
+# scripts/measure_email_memory.py
+"""
+Peak Python heap per email while sending concurrently, SDK-style payload vs
+the streamed body in email_payload.py.
+
+  python scripts/measure_email_memory.py
+  python scripts/measure_email_memory.py --pdf-kb 4096 --concurrency 16
+
+"sdk" builds the attachment the way the Resend SDK needs it (base64 str in
+a params dict posted with requests' json=); "streamed" posts an EmailBody.
+Both go to a throwaway sink server in a child process, so only the sending
+side is measured (tracemalloc, with the PDF itself allocated beforehand).
+"""
+import argparse, base64, os, subprocess, sys, threading, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import requests
+from email_payload import EmailBody
+
+SINK = r"""
+import base64, json, sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+class H(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        size = len(base64.b64decode(body["attachments"][0]["content"]))
+        out = json.dumps({"id": "sink", "attachment_bytes": size}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+    def log_message(self, *args):
+        pass
+ThreadingHTTPServer.request_queue_size = 128
+srv = ThreadingHTTPServer(("127.0.0.1", 0), H)
+print(srv.server_address[1], flush=True)
+srv.serve_forever()
+"""
+
+def params_for(pdf_bytes):
+    return {
+        "from": "reports@api.nodalpathways.com",
+        "to": "reader@example.com",
+        "subject": "Your Nodal Pathways Report",
+        "html": "<p>report</p>" * 200,
+        "attachments": [{"filename": "nodal_pathways_report.pdf", "content": pdf_bytes}],
+    }
+
+def send_sdk(url, pdf_bytes):
+    params = params_for(base64.b64encode(pdf_bytes).decode("utf-8"))
+    return requests.post(url, json=params, timeout=60).json()
+
+def send_streamed(url, pdf_bytes):
+    return requests.post(url, data=EmailBody(params_for(pdf_bytes)),
+                         headers={"Content-Type": "application/json"}, timeout=60).json()
+
+def measure(send, url, pdf_bytes, concurrency):
+    barrier = threading.Barrier(concurrency)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(send(url, pdf_bytes))
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    ok = all(r.get("attachment_bytes") == len(pdf_bytes) for r in results)
+    return peak - base, elapsed, ok
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pdf-kb", type=int, default=1024)
+    ap.add_argument("--concurrency", type=int, default=8)
+    args = ap.parse_args()
+
+    sink = subprocess.Popen([sys.executable, "-c", SINK], stdout=subprocess.PIPE, text=True)
+    try:
+        url = f"http://127.0.0.1:{sink.stdout.readline().strip()}/emails"
+        pdf_bytes = os.urandom(args.pdf_kb * 1024)
+        send_sdk(url, pdf_bytes[:1024])  # warm up connection pools and imports
+
+        print(f"PDF {args.pdf_kb} KB, {args.concurrency} concurrent sends\n")
+        print("| payload | peak MB | per email MB | x PDF size | seconds | intact |\n|---|---:|---:|---:|---:|---|")
+        for name, send in (("sdk", send_sdk), ("streamed", send_streamed)):
+            peak, elapsed, ok = measure(send, url, pdf_bytes, args.concurrency)
+            per_email = peak / args.concurrency
+            print(f"| {name} | {peak / 2**20:.1f} | {per_email / 2**20:.2f} | "
+                  f"{per_email / len(pdf_bytes):.2f} | {elapsed:.2f} | {ok} |")
+    finally:
+        sink.kill()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# scripts/mock_email_server.py
+"""
+Local Resend-compatible stand-in for load testing email delivery offline.
+
+Run:   python scripts/mock_email_server.py
+Point: RESEND_API_URL=http://127.0.0.1:8090 python app.py
+
+Accepts POST /emails and /emails/batch like the Resend API (base64
+attachments are decoded to check them and count their bytes) and answers
+with message ids, honouring the Idempotency-Key header. Delivery goes through
+email_transports.MockTransport, so EMAIL_LATENCY delays each call and
+EMAIL_ERROR_RATE / EMAIL_REJECT_RATE inject 429 / 422 responses;
+EMAIL_RECORD_PATH appends a JSONL summary per accepted message.
+GET /stats returns the counts and the most recent summaries.
+"""
+import base64, binascii, json, os, sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from email_outbox import SendError
+from email_transports import MockTransport
+
+HOST = os.getenv("MOCK_EMAIL_HOST", "127.0.0.1")
+PORT = int(os.getenv("MOCK_EMAIL_PORT", "8090"))
+
+transport = MockTransport(
+    latency=os.getenv("EMAIL_LATENCY", "0"),
+    error_rate=float(os.getenv("EMAIL_ERROR_RATE", "0")),
+    reject_rate=float(os.getenv("EMAIL_REJECT_RATE", "0")),
+    record_path=os.getenv("EMAIL_RECORD_PATH") or None
+)
+
+def decode_attachments(params):
+    for attachment in params.get("attachments", ()):
+        attachment["content"] = base64.b64decode(attachment.get("content", ""), validate=True)
+    return params
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/stats":
+            return self._send_json(404, {"name": "not_found", "message": "Not found"})
+        self._send_json(200, {"counts": transport.stats(), "recent": list(transport.messages)[-20:]})
+
+    def do_POST(self):
+        path = self.path.rstrip("/")
+        if path not in ("/emails", "/emails/batch"):
+            return self._send_json(404, {"name": "not_found", "message": "Not found"})
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            req = json.loads(self.rfile.read(length) or b"{}")
+            if path == "/emails":
+                req = decode_attachments(req)
+            elif any(params.get("attachments") for params in req):
+                raise ValueError("Attachments are not supported in batch emails")
+        except (ValueError, binascii.Error) as e:
+            return self._send_json(422, {"name": "validation_error", "message": str(e)})
+
+        try:
+            if path == "/emails":
+                return self._send_json(200, {"id": transport.send(req, self.headers.get("Idempotency-Key"))})
+            ids = transport.send_batch(req)
+        except SendError as e:
+            status = 429 if e.retryable else 422
+            return self._send_json(status, {"name": "mock_error", "message": str(e)})
+        self._send_json(200, {"data": [{"id": message_id} for message_id in ids]})
+
+    def log_message(self, fmt, *args):
+        pass
+
+def main():
+    ThreadingHTTPServer.request_queue_size = 128  # bulk sends open many connections at once
+    server = ThreadingHTTPServer((HOST, PORT), Handler)
+    print(f"Mock email API listening on http://{HOST}:{PORT}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
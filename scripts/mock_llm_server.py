@@ -0,0 +1,104 @@
+# scripts/mock_llm_server.py
+"""
+Local OpenAI-compatible stand-in for load testing /process-form offline.
+
+Run:   python scripts/mock_llm_server.py
+Point: LLM_API_BASE=http://127.0.0.1:8089/v1 python app.py
+
+Answers POST /v1/chat/completions with recorded fixtures (LLM_FIXTURES_PATH)
+or synthetic SECTION: text, after a delay drawn from LLM_LATENCY
+(see llm_backends.parse_latency). With "stream": true the text is sent as
+server-sent events, MOCK_LLM_TOKEN_MS apart, so output length drives latency.
+MOCK_LLM_ERROR_RATE injects 429 responses.
+"""
+import json, os, random, re, sys, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from llm_backends import FixtureStore, count_tokens, parse_latency, synthetic_completion
+
+HOST = os.getenv("MOCK_LLM_HOST", "127.0.0.1")
+PORT = int(os.getenv("MOCK_LLM_PORT", "8089"))
+ERROR_RATE = float(os.getenv("MOCK_LLM_ERROR_RATE", "0"))
+TOKEN_DELAY = float(os.getenv("MOCK_LLM_TOKEN_MS", "0")) / 1000.0
+
+fixtures = FixtureStore(os.getenv("LLM_FIXTURES_PATH") or None)
+sample_latency = parse_latency(os.getenv("LLM_LATENCY", "fixed:1500"))
+
+TOKEN_RE = re.compile(r"\s*\S+")
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, model, text):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        base = {"id": f"chatcmpl-mock-{int(time.time() * 1000)}", "object": "chat.completion.chunk",
+                "created": int(time.time()), "model": model}
+        for i, piece in enumerate(TOKEN_RE.findall(text)):
+            if i and TOKEN_DELAY:
+                time.sleep(TOKEN_DELAY)
+            chunk = dict(base, choices=[{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        chunk = dict(base, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+        self.wfile.write(f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._send_json(404, {"error": {"message": "Not found"}})
+        length = int(self.headers.get("Content-Length", 0))
+        req = json.loads(self.rfile.read(length) or b"{}")
+        prompt = "\n".join(m.get("content", "") for m in req.get("messages", []))
+
+        time.sleep(sample_latency())
+        if ERROR_RATE and random.random() < ERROR_RATE:
+            return self._send_json(429, {"error": {"message": "Rate limit reached (mock)", "type": "requests"}})
+
+        text = fixtures.lookup(prompt)
+        if text is None:
+            text = synthetic_completion(prompt)
+        if req.get("stream"):
+            return self._stream(req.get("model", "gpt-4"), text)
+        prompt_tokens, completion_tokens = count_tokens(prompt), count_tokens(text)
+        self._send_json(200, {
+            "id": f"chatcmpl-mock-{int(time.time() * 1000)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": req.get("model", "gpt-4"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+    def log_message(self, fmt, *args):
+        pass
+
+def main():
+    server = ThreadingHTTPServer((HOST, PORT), Handler)
+    print(f"Mock LLM listening on http://{HOST}:{PORT}/v1 ({len(fixtures.records)} fixtures)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
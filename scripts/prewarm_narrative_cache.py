@@ -0,0 +1,121 @@
+# scripts/prewarm_narrative_cache.py
+"""
+Fill the AI narrative cache ahead of traffic.
+
+  NARRATIVE_CACHE_PATH=narratives.db python scripts/prewarm_narrative_cache.py --top 500
+  NARRATIVE_CACHE_PATH=narratives.db python scripts/prewarm_narrative_cache.py --all --rpm 200
+
+Uses the same LLM backend, prompt template (PROMPT_VARIANT) and model settings
+as app.py. Already-cached combinations are skipped, so an interrupted run
+resumes where it stopped; per-combination status and attempts are kept in the
+cache's prewarm_progress table. Requests are throttled to --rpm, and a rate
+limit error pauses every worker with exponential backoff.
+"""
+import argparse, os, random, sys, threading, time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from llm_backends import get_llm_backend
+from narrative_cache import NarrativeCache, all_placements, cache_key, render_prompt
+from prompts import get_template
+
+CACHE_PATH = os.getenv("NARRATIVE_CACHE_PATH", "narrative_cache.db")
+AI_MODEL = os.getenv("AI_MODEL", "gpt-4")
+AI_MAX_TOKENS = int(os.getenv("AI_MAX_TOKENS", "2000"))
+
+class RateGate:
+    """Spaces request starts to at most rpm per minute and honours shared cool-downs."""
+
+    def __init__(self, rpm):
+        self.interval = 60.0 / rpm if rpm else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+        self.cooldown_until = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot, self.cooldown_until)
+            self.next_slot = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def cool_down(self, seconds):
+        with self.lock:
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + seconds)
+
+def is_rate_limit(err):
+    name = type(err).__name__
+    return name in ("RateLimitError", "ServiceUnavailableError") or "429" in str(err)
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    which = ap.add_mutually_exclusive_group(required=True)
+    which.add_argument("--top", type=int, help="warm the N most requested placement combinations")
+    which.add_argument("--all", action="store_true", help="warm every sun/moon/rising/node combination")
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--rpm", type=float, default=60, help="max requests started per minute (0 = unlimited)")
+    ap.add_argument("--max-retries", type=int, default=5)
+    ap.add_argument("--limit", type=int, help="stop after this many completions")
+    args = ap.parse_args()
+
+    cache = NarrativeCache(CACHE_PATH)
+    template = get_template("report")
+    llm = get_llm_backend()
+    gate = RateGate(args.rpm)
+
+    todo_source = cache.top_placements(args.top) if args.top else all_placements()
+    done = cache.cached_keys(template.digest)
+    todo = [p for p in todo_source if cache_key(template.digest, p) not in done]
+    if args.limit:
+        todo = todo[:args.limit]
+    previously_failed = len(cache.failed_keys())
+    print(f"{template.key} ({template.digest}): {len(done)} cached, {len(todo)} to generate"
+          + (f", {previously_failed} failed in earlier runs" if previously_failed else ""))
+
+    counts = {"ok": 0, "failed": 0}
+    counts_lock = threading.Lock()
+    stop = threading.Event()
+
+    def warm(placements):
+        key = cache_key(template.digest, placements)
+        for attempt in range(args.max_retries + 1):
+            gate.wait()
+            if stop.is_set():
+                return
+            try:
+                completion = llm.complete(render_prompt(template, placements),
+                                          model=AI_MODEL, max_tokens=AI_MAX_TOKENS, temperature=0.7)
+            except Exception as e:
+                if attempt < args.max_retries and is_rate_limit(e):
+                    gate.cool_down(min(60.0, 2 ** attempt) + random.random())
+                    continue
+                cache.set_progress(key, "failed", str(e)[:500])
+                with counts_lock:
+                    counts["failed"] += 1
+                print(f"FAILED {key}: {e}")
+                return
+            cache.put(template.digest, placements, completion.text)
+            cache.set_progress(key, "done")
+            with counts_lock:
+                counts["ok"] += 1
+                n = counts["ok"] + counts["failed"]
+            if n % 25 == 0:
+                print(f"{n}/{len(todo)} processed ({counts['failed']} failed)")
+            return
+
+    # Not a with-block: its exit waits for every queued completion, Ctrl-C included.
+    pool = ThreadPoolExecutor(max_workers=args.concurrency)
+    try:
+        for future in [pool.submit(warm, p) for p in todo]:
+            future.result()
+        pool.shutdown()
+    except KeyboardInterrupt:
+        stop.set()
+        print("Interrupted; finishing in-flight requests, rerun to resume.")
+        pool.shutdown(cancel_futures=True)
+    print(f"Done: {counts['ok']} generated, {counts['failed']} failed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# scripts/startup_report.py
+"""
+Startup-time report: what importing app.py costs, and what each lazily
+imported dependency costs on first use.
+
+  python scripts/startup_report.py            # markdown table to stdout
+  python scripts/startup_report.py --top 25
+
+Each measurement runs in a fresh interpreter with -X importtime, so results
+are cold-import times (bytecode caches warm).
+"""
+import argparse, os, subprocess, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = [
+    "swisseph", "timezonefinder", "pytz", "requests", "openai",
+    "reportlab.platypus", "pdf_styles",
+]
+
+def importtime(statement):
+    """
+    Run statement in a fresh interpreter with -X importtime.
+    Returns [(level, module, cumulative us)]; level 0 is imported by the
+    statement itself, level 1 by those modules, and so on.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True,
+        env=dict(os.environ, LLM_BACKEND=os.getenv("LLM_BACKEND", "mock"))
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _self_us, cum_us, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((level, name.strip(), int(cum_us)))
+    return rows
+
+_startup = None
+
+def statement_cost(statement):
+    """
+    (total us, {module: us} for modules the top-level imports pulled in),
+    excluding what a bare interpreter start already imports.
+    """
+    global _startup
+    if _startup is None:
+        _startup = {name for level, name, _ in importtime("pass") if level == 0}
+    total, children = 0, {}
+    for level, name, us in importtime(statement):
+        if level == 0 and name not in _startup:
+            total += us
+        elif level == 1:
+            children[name] = us
+    return total, children
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--top", type=int, default=15)
+    args = ap.parse_args()
+
+    app_total, app_mods = statement_cost("import app")
+    print("## `import app`\n")
+    print(f"Total: {app_total / 1000:.1f} ms\n")
+    print("| module | cumulative ms |\n|---|---:|")
+    for name, us in sorted(app_mods.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"| {name} | {us / 1000:.1f} |")
+
+    print("\n## Deferred until first use\n")
+    print("| module | cold import ms |\n|---|---:|")
+    deferred_total = 0
+    for mod in LAZY_MODULES:
+        total, _ = statement_cost(f"import {mod}")
+        deferred_total += total
+        print(f"| {mod} | {total / 1000:.1f} |")
+    print(f"\nDeferred total (overlapping shared deps): {deferred_total / 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# singleflight.py
+"""Collapse concurrent calls that share a key into a single execution."""
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Per-key call coalescing. The first caller for a key (the leader) runs fn;
+    callers arriving while it is in flight wait for and share its result.
+    Nothing is cached: once the leader finishes, the next call runs fn again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout=None):
+        """
+        Run fn() once for all concurrent callers of key.
+        Returns (result, shared) where shared is True for waiters.
+        Waiters raise TimeoutError if the leader takes longer than timeout seconds;
+        an exception raised by fn is re-raised in the leader and every waiter.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+            return call.result, False
+
+        if not call.done.wait(timeout):
+            raise TimeoutError(f"Timed out after {timeout}s waiting on in-flight call for {key!r}")
+        if call.error is not None:
+            raise call.error
+        return call.result, True
+
+    def in_flight(self):
+        """Return {key: waiter_count} for calls currently running."""
+        with self._lock:
+            return {k: c.waiters for k, c in self._calls.items()}
@@ -0,0 +1,88 @@
+# tests/test_email_outbox.py
+import time
+
+from email_outbox import Outbox, OutboxSender, SendError
+
+def params(content=b"%PDF-1.4"):
+    return {"to": "reader@example.com", "subject": "Report",
+            "attachments": [{"filename": "report.pdf", "content": content}]}
+
+def rows(outbox):
+    return dict(outbox._conn().execute("SELECT key, status FROM outbox").fetchall())
+
+def test_expired_lease_is_reclaimed_and_old_holder_skipped(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"), lease=0.2)
+    outbox.enqueue("k", params())
+    first = outbox.renew(outbox.claim(1))
+    assert [m.key for m in first] == ["k"]
+
+    time.sleep(0.3)  # first holder's lease runs out mid-send
+    second = outbox.claim(1)
+    assert [m.key for m in second] == ["k"]
+    assert outbox.renew(first) == []  # the old holder may not send again
+
+    outbox.finish([(first[0], "sent", "id-first", None)])
+    assert rows(outbox) == {"k": "sending"}  # ignored: no longer held
+
+    second = outbox.renew(second)
+    outbox.finish([(second[0], "sent", "id-second", None)])
+    provider_id, attempts = outbox._conn().execute(
+        "SELECT provider_id, attempts FROM outbox WHERE key = 'k'").fetchone()
+    assert (provider_id, attempts) == ("id-second", 2)
+
+def test_sender_delivers_each_message_once_when_sends_outlast_the_lease(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"), lease=0.5)
+    for i in range(3):
+        outbox.enqueue(f"k{i}", params())
+    sent = []
+
+    def send(p, key):
+        time.sleep(0.35)
+        sent.append(key)
+        return "id-" + key
+
+    senders = [OutboxSender(outbox, send, workers=1, poll_interval=0.02).start() for _ in range(2)]
+    deadline = time.time() + 10
+    while outbox.stats().get("sent", 0) < 3 and time.time() < deadline:
+        time.sleep(0.05)
+    for s in senders:
+        s.stop()
+    assert sorted(sent) == ["k0", "k1", "k2"]
+
+def test_enqueue_is_idempotent_until_the_message_fails(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    assert outbox.enqueue("k", params(b"first"))
+    assert not outbox.enqueue("k", params(b"second"))
+
+    m = outbox.renew(outbox.claim(1))[0]
+    outbox.finish([(m, "failed", "422", None)])
+    assert outbox.status("k") == "failed"
+
+    assert outbox.enqueue("k", params(b"third"))
+    assert outbox.status("k") == "pending"
+    (m,) = outbox.claim(1)
+    assert m.attempts == 0
+    assert m.params["attachments"][0]["content"] == b"third"
+
+def test_permanent_error_fails_without_retry(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    outbox.enqueue("k", params())
+
+    def send(p, key):
+        raise SendError("422 invalid", retryable=False)
+
+    assert OutboxSender(outbox, send).run_once() == 1
+    assert outbox.status("k") == "failed"
+
+def test_purge_removes_old_sent_and_failed_messages(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    for key in ("sent", "failed", "pending"):
+        outbox.enqueue(key, params())
+    held = {m.key: m for m in outbox.renew(outbox.claim(2))}
+    outbox.finish([(held["sent"], "sent", "id", None), (held["failed"], "failed", "e", None)])
+    outbox._conn().execute("UPDATE outbox SET updated_at = updated_at - 100")
+
+    assert outbox.purge(50, 50) == 2
+    assert rows(outbox) == {"pending": "pending"}
+    keys = outbox._conn().execute("SELECT DISTINCT key FROM outbox_attachments").fetchall()
+    assert keys == [("pending",)]
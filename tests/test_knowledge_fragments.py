@@ -0,0 +1,16 @@
+# tests/test_knowledge_fragments.py
+import json
+
+from knowledge_fragments import FragmentTable
+
+def test_entries_round_trip_through_json_without_guessing_at_ids():
+    table = FragmentTable()
+    entry = {
+        "text": "First sentence. Second sentence.",
+        "themes": ["One. Two.", "Three."],
+        "degrees": [3, 14],  # ints, not fragment ids
+        "empty": [],
+        "weight": 5,
+    }
+    stored = json.loads(json.dumps(table.encode_entry(entry)))
+    assert table.decode_entry(stored) == entry
@@ -0,0 +1,25 @@
+# tests/test_narrative_cache.py
+from narrative_cache import NarrativeCache
+
+LEO = ("Leo", "Leo", "Leo", "Leo", "Aquarius")
+ARIES = ("Aries", "Leo", "Leo", "Leo", "Libra")
+
+def stored_hits(cache):
+    return dict(cache._conn().execute("SELECT placements, hits FROM placement_stats").fetchall())
+
+def test_lookups_are_buffered_until_the_flush_interval(tmp_path):
+    cache = NarrativeCache(str(tmp_path / "narratives.db"), lookup_flush_interval=3600)
+    for placements in (LEO, LEO, ARIES):
+        cache.record_lookup(placements)
+    assert stored_hits(cache) == {}
+
+    assert cache.top_placements(2) == [LEO, ARIES]  # reads flush first
+    cache.record_lookup(ARIES)
+    cache.record_lookup(ARIES)
+    cache.flush_lookups()
+    assert stored_hits(cache) == {"|".join(LEO): 2, "|".join(ARIES): 3}
+
+def test_lookups_flush_once_the_interval_has_passed(tmp_path):
+    cache = NarrativeCache(str(tmp_path / "narratives.db"), lookup_flush_interval=0)
+    cache.record_lookup(LEO)
+    assert stored_hits(cache) == {"|".join(LEO): 1}
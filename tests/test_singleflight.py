@@ -0,0 +1,87 @@
+# tests/test_singleflight.py
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight
+
+def start_leader(flight, key, fn):
+    """Run flight.do(key, fn) on a thread; returns (thread, outcome dict) once fn has started."""
+    started = threading.Event()
+    outcome = {}
+
+    def leader_fn():
+        started.set()
+        return fn()
+
+    def run():
+        try:
+            outcome["result"] = flight.do(key, leader_fn)
+        except BaseException as e:
+            outcome["error"] = e
+
+    t = threading.Thread(target=run)
+    t.start()
+    assert started.wait(5)
+    return t, outcome
+
+def test_waiters_share_the_leader_result():
+    flight, release, calls = SingleFlight(), threading.Event(), []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "text"
+
+    leader, outcome = start_leader(flight, "k", fn)
+    results = []
+    waiters = [threading.Thread(target=lambda: results.append(flight.do("k", fn, timeout=5)))
+               for _ in range(3)]
+    for w in waiters:
+        w.start()
+    while flight.in_flight().get("k", 0) < 3:
+        time.sleep(0.01)
+    release.set()
+    for t in [leader] + waiters:
+        t.join(5)
+    assert outcome["result"] == ("text", False)
+    assert results == [("text", True)] * 3
+    assert calls == [1]
+
+def test_waiters_receive_the_leader_exception():
+    flight, release = SingleFlight(), threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    leader, outcome = start_leader(flight, "k", fn)
+    errors = []
+
+    def wait():
+        try:
+            flight.do("k", lambda: "not called", timeout=5)
+        except ValueError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    while flight.in_flight().get("k", 0) < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+    assert isinstance(outcome["error"], ValueError)
+    assert errors == [outcome["error"]]
+
+def test_waiter_times_out_while_leader_keeps_running():
+    flight, release = SingleFlight(), threading.Event()
+    leader, outcome = start_leader(flight, "k", lambda: release.wait(5) and "late")
+    with pytest.raises(TimeoutError):
+        flight.do("k", lambda: "not called", timeout=0.05)
+    release.set()
+    leader.join(5)
+    assert outcome["result"] == ("late", False)
+    assert flight.in_flight() == {}
+    assert flight.do("k", lambda: "fresh") == ("fresh", False)  # nothing cached